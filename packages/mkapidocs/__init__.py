@@ -6,6 +6,33 @@ feature detection for Python projects.
 
 from __future__ import annotations
 
-from .version import __version__
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .version import __version__
 
 __all__ = ["__version__"]
+
+
+def __getattr__(name: str) -> str:
+    """Resolve ``__version__`` on first access (PEP 562).
+
+    Computing the version consults hatchling or importlib.metadata, which
+    importing submodules such as ``mkapidocs.cli`` should not pay for.
+
+    Args:
+        name: Attribute name being looked up on the package
+
+    Returns:
+        The package version string when ``name`` is ``__version__``
+
+    Raises:
+        AttributeError: If ``name`` is not a lazily provided attribute
+    """
+    if name == "__version__":
+        from .version import __version__  # noqa: PLC0415
+
+        globals()["__version__"] = __version__
+        return __version__
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -150,6 +150,43 @@ def _is_port_in_use(host: str, port: int) -> bool:
         return result == 0
 
 
+def _is_process_alive(pid: int) -> bool:
+    """Check if a process still exists.
+
+    Args:
+        pid: Process ID to check.
+
+    Returns:
+        True if the process exists, False once it has exited.
+    """
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Exists but belongs to another user
+        return True
+    return True
+
+
+def _wait_for_exit(pids: list[int], timeout: float) -> None:
+    """Wait until all processes have exited or the timeout elapses.
+
+    Polls rather than sleeping for the full timeout, so a server that stops
+    promptly does not delay startup. Elapsed time is measured with the
+    monotonic perf_counter so clock adjustments cannot shorten or extend it.
+
+    Args:
+        pids: Process IDs to wait for.
+        timeout: Maximum time to wait, in seconds.
+    """
+    deadline = time.perf_counter() + timeout
+    while (pids := [pid for pid in pids if _is_process_alive(pid)]) and (
+        time.perf_counter() < deadline
+    ):
+        time.sleep(0.05)
+
+
 def _kill_process_on_port(port: int) -> bool:
     """Kill any process using the specified port.
 
@@ -171,15 +208,14 @@ def _kill_process_on_port(port: int) -> bool:
             check=False,
         )
         if result.returncode == 0 and result.stdout.strip():
-            pids = result.stdout.strip().split("\n")
+            pids = [int(pid) for pid in result.stdout.split() if pid.isdigit()]
             for pid in pids:
-                if pid.isdigit():
-                    console.print(
-                        f"[yellow]Stopping existing process on port {port} (PID: {pid})...[/yellow]"
-                    )
-                    os.kill(int(pid), signal.SIGINT)
+                console.print(
+                    f"[yellow]Stopping existing process on port {port} (PID: {pid})...[/yellow]"
+                )
+                os.kill(pid, signal.SIGINT)
             # Give processes time to shut down gracefully
-            time.sleep(1)
+            _wait_for_exit(pids, timeout=1.0)
             return True
     except (OSError, subprocess.SubprocessError):
         pass
@@ -9,7 +9,6 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Annotated
 
-import httpx
 import typer
 from rich.console import Console
 from tomlkit.exceptions import TOMLKitError
@@ -280,6 +279,9 @@ def setup(
             title="Deprecated Option",
         )
 
+    # Deferred import - httpx is only needed for setup's GitLab API lookups
+    import httpx  # noqa: PLC0415
+
     try:
         display_message(
             f"Setting up documentation for [bold cyan]{repo_path}[/bold cyan]...",
@@ -9,7 +9,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from rich.console import Console, RenderableType
-from rich.measure import Measurement
 
 if TYPE_CHECKING:
     from rich.panel import Panel
@@ -32,8 +31,9 @@ def get_rendered_width(renderable: RenderableType) -> int:
     Returns:
         Width in characters needed to display the renderable.
     """
-    temp_console = Console(width=9999)
-    measurement = Measurement.get(temp_console, temp_console.options, renderable)
+    measurement = console.measure(
+        renderable, options=console.options.update(width=9999)
+    )
     return int(measurement.maximum)
 
 
@@ -6,19 +6,21 @@ import ast
 import http
 import os
 import re
+import shutil
 import subprocess
 from contextlib import suppress
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from shutil import which
-from typing import TYPE_CHECKING, cast
+from tempfile import NamedTemporaryFile
+from typing import TYPE_CHECKING, TypeAlias, cast
 
-import httpx
 import tomlkit
 import typer
-from jinja2 import Environment
 from rich.console import Console
 from rich.panel import Panel
+from rich.text import Text
 from tomlkit.exceptions import TOMLKitError
 
 from mkapidocs.builder import is_mkapidocs_in_target_env
@@ -28,6 +30,7 @@ from mkapidocs.models import (
     GitLabIncludeAdapter,
     GitLabIncludeLocal,
     MessageType,
+    ProjectConfig,
     PyprojectConfig,
     TomlTable,
 )
@@ -36,6 +39,7 @@ from mkapidocs.project_detection import (
     detect_typer_dependency,
     read_pyproject,
 )
+from mkapidocs.runtime import get_executor
 from mkapidocs.templates import (
     C_API_MD_TEMPLATE,
     CLI_MD_TEMPLATE,
@@ -54,7 +58,9 @@ from mkapidocs.yaml_utils import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterator, Mapping, Sequence
+
+    from jinja2 import Environment, Template
 
 # Initialize Rich console
 console = Console()
@@ -71,11 +77,11 @@ def display_message(
         title: Optional panel title (defaults to message type)
     """
     color, default_title = message_type.value
-    panel_title = title or default_title
 
+    # Titles are plain text, so style a Text directly instead of parsing markup
     panel = Panel.fit(
         message,
-        title=f"[bold {color}]{panel_title}[/bold {color}]",
+        title=Text(title or default_title, style=f"bold {color}"),
         border_style=color,
         padding=(1, 2),
     )
@@ -152,10 +158,20 @@ def _resolve_git_dir(repo_path: Path) -> Path | None:
     return _resolve_worktree_gitdir(repo_path, gitdir_path)
 
 
+# First "url = <url>" line of a git config, with any leading whitespace.
+# Horizontal whitespace only, so a match never spills onto the next line.
+_GIT_CONFIG_URL_RE = re.compile(r"^[ \t\f\v]*url =[ \t\f\v](.*)$", re.MULTILINE)
+# The same line, but only within the [remote "origin"] section
+_GIT_ORIGIN_URL_RE = re.compile(
+    r'^\[remote "origin"\][^\[]*?^[ \t\f\v]*url =[ \t\f\v](.*)$', re.MULTILINE
+)
+
+
 def get_git_remote_url(repo_path: Path) -> str | None:
     """Get git remote URL from repository.
 
-    Handles both regular repositories and git worktrees.
+    Handles both regular repositories and git worktrees. The origin remote is
+    used when configured, otherwise the first remote URL in the config.
 
     Args:
         repo_path: Path to repository.
@@ -167,23 +183,26 @@ def get_git_remote_url(repo_path: Path) -> str | None:
     if git_dir is None:
         return None
 
-    git_config_path = git_dir / "config"
-    if not git_config_path.exists():
-        return None
-
     try:
-        config_content = git_config_path.read_text(encoding="utf-8")
+        config_content = (git_dir / "config").read_text(encoding="utf-8")
     except (OSError, UnicodeDecodeError):
         return None
 
-    # Match lines like "url = <url>" with any leading whitespace
-    pattern = r"^\s*url =\s(.*)$"
-    for line in config_content.splitlines():
-        if match := re.match(pattern, line):
+    # Prefer origin, falling back to the first remote for repos without one
+    for pattern in (_GIT_ORIGIN_URL_RE, _GIT_CONFIG_URL_RE):
+        if match := pattern.search(config_content):
             return match.group(1).strip()
     return None
 
 
+# Git remote URL patterns, compiled once at import
+_SSH_URL_WITH_PORT_RE = re.compile(
+    r"^(?:ssh://)?git@([^:]+)(?::[0-9]+)?[:/](.+?)(?:\.git)?$"
+)
+_SSH_REMOTE_RE = re.compile(r"^(?:ssh://)?git@([^:]+)[:/](.+?)(?:\.git)?$")
+_HTTPS_REMOTE_RE = re.compile(r"^https://(?:[^@]+@)?([^/]+)/(.+?)(?:\.git)?$")
+
+
 def convert_ssh_to_https(git_url: str) -> str:
     """Convert SSH git URL to HTTPS format.
 
@@ -193,9 +212,7 @@ def convert_ssh_to_https(git_url: str) -> str:
     Returns:
         HTTPS URL format.
     """
-    if ssh_protocol_match := re.match(
-        r"^(?:ssh://)?git@([^:]+)(?::[0-9]+)?[:/](.+?)(?:\.git)?$", git_url
-    ):
+    if ssh_protocol_match := _SSH_URL_WITH_PORT_RE.match(git_url):
         host = ssh_protocol_match.group(1)
         path = ssh_protocol_match.group(2)
         return f"https://{host}/{path}"
@@ -215,27 +232,14 @@ def _parse_git_remote(remote_url: str) -> tuple[str, str, str] | None:
         Namespace may contain slashes for nested groups (e.g., "group/subgroup").
     """
     # SSH format: git@host:namespace/project.git or git@host:group/subgroup/project.git
-    ssh_match = re.match(r"^(?:ssh://)?git@([^:]+)[:/](.+?)(?:\.git)?$", remote_url)
-    if ssh_match:
-        host = ssh_match.group(1)
-        path = ssh_match.group(2)
-        # Split path into namespace (everything before last /) and project (last segment)
-        if "/" in path:
-            last_slash = path.rfind("/")
-            namespace = path[:last_slash]
-            project = path[last_slash + 1 :]
-            return host, namespace, project
-
     # HTTPS format: https://host/namespace/project.git
-    https_match = re.match(r"^https://(?:[^@]+@)?([^/]+)/(.+?)(?:\.git)?$", remote_url)
-    if https_match:
-        host = https_match.group(1)
-        path = https_match.group(2)
-        if "/" in path:
-            last_slash = path.rfind("/")
-            namespace = path[:last_slash]
-            project = path[last_slash + 1 :]
-            return host, namespace, project
+    for pattern in (_SSH_REMOTE_RE, _HTTPS_REMOTE_RE):
+        if remote_match := pattern.match(remote_url):
+            host, path = remote_match.groups()
+            # Split path into namespace (everything before last /) and project (last segment)
+            namespace, slash, project = path.rpartition("/")
+            if slash:
+                return host, namespace, project
 
     return None
 
@@ -459,6 +463,9 @@ def query_gitlab_pages_url(gitlab_host: str, project_path: str) -> GitLabPagesRe
     if not token:
         return GitLabPagesResult(error="no_token")
 
+    # Deferred import - only needed when a GitLab token is available
+    import httpx  # noqa: PLC0415
+
     graphql_url = f"https://{gitlab_host}/api/graphql"
     payload = {"query": _GITLAB_PAGES_QUERY, "variables": {"projectPath": project_path}}
 
@@ -484,6 +491,11 @@ def query_gitlab_pages_url(gitlab_host: str, project_path: str) -> GitLabPagesRe
         return GitLabPagesResult(error=f"Parse error: {e}")
 
 
+# Provider names as whole words in a remote URL; GitHub is checked first
+_GITHUB_WORD_RE = re.compile(r"\bgithub\b")
+_GITLAB_WORD_RE = re.compile(r"\bgitlab\b")
+
+
 def detect_ci_provider(repo_path: Path) -> CIProvider | None:
     """Detect CI/CD provider from git remote URL or filesystem indicators.
 
@@ -500,9 +512,9 @@ def detect_ci_provider(repo_path: Path) -> CIProvider | None:
     """
     # Strategy 1: Check git remote URL
     if remote_url := get_git_remote_url(repo_path):
-        if re.search(r"\bgithub\b", remote_url):
+        if _GITHUB_WORD_RE.search(remote_url):
             return CIProvider.GITHUB
-        if re.search(r"\bgitlab\b", remote_url):
+        if _GITLAB_WORD_RE.search(remote_url):
             return CIProvider.GITLAB
 
     # Strategy 2: Check filesystem for CI/CD indicators
@@ -632,16 +644,147 @@ def ensure_mkapidocs_installed(repo_path: Path) -> bool:
         return True
 
 
+# Keys whose content comes from PyprojectConfig. None marks a table the model
+# owns entirely; [project] keys outside ProjectConfig (readme, authors, ...)
+# are not modelled and belong to the user.
+_OwnedKeys: TypeAlias = "Mapping[str, _OwnedKeys | None]"
+_PYPROJECT_OWNED_KEYS: _OwnedKeys = {
+    "project": dict.fromkeys(
+        field.alias or name for name, field in ProjectConfig.model_fields.items()
+    ),
+    "tool": None,
+}
+
+
+def _apply_toml_changes(
+    table: dict[str, object],
+    values: dict[str, object],
+    owned_keys: _OwnedKeys | None = None,
+) -> None:
+    """Update a parsed TOML table in place with only the values that differ.
+
+    Nested tables are walked rather than replaced and equal values are left
+    alone, so untouched entries keep their comments and formatting. Owned keys
+    missing from ``values`` are removed, as are owned keys whose value became
+    an empty container; empty containers the table lacks (model defaults such
+    as ``scripts = {}``) are not added.
+
+    Args:
+        table: Parsed tomlkit table to update.
+        values: Plain values the table should contain.
+        owned_keys: Keys of ``table`` the model owns, mapped to the owned keys
+            of their nested tables; None when every key is owned.
+    """
+    for key in [key for key in table if key not in values]:
+        if owned_keys is None or key in owned_keys:
+            del table[key]
+    for key, value in values.items():
+        current = table.get(key)
+        if isinstance(current, dict) and isinstance(value, dict) and value:
+            _apply_toml_changes(
+                cast("dict[str, object]", current),
+                cast("dict[str, object]", value),
+                None if owned_keys is None else owned_keys.get(key),
+            )
+        elif not value and isinstance(value, (dict, list)):
+            if key in table and current != value:
+                del table[key]
+        elif key not in table or current != value:
+            table[key] = value
+
+
 def write_pyproject(repo_path: Path, config: PyprojectConfig) -> None:
     """Write pyproject.toml from typed configuration.
 
+    An existing file is updated in place through tomlkit, touching only values
+    that changed, so comments, formatting and tables outside the model (such as
+    ``[build-system]``) survive. Modelled keys the configuration no longer
+    holds are removed. The file is left untouched when nothing
+    changed, so re-runs don't bump its mtime. Otherwise the new content is
+    written to a uniquely named sibling temporary file, given the original
+    file's mode, and moved into place, so readers never see a partial file.
+
     Args:
         repo_path: Path to repository.
         config: Typed configuration to write.
     """
     pyproject_path = repo_path / "pyproject.toml"
-    with Path(pyproject_path).open("w", encoding="utf-8") as f:
-        tomlkit.dump(config.to_dict(), f)
+    values = config.to_dict()
+
+    existing_content: str | None = None
+    with suppress(OSError, UnicodeDecodeError):
+        existing_content = pyproject_path.read_text(encoding="utf-8")
+
+    content: str | None = None
+    if existing_content is not None:
+        with suppress(TOMLKitError):
+            document = tomlkit.parse(existing_content)
+            _apply_toml_changes(
+                document, cast("dict[str, object]", values), _PYPROJECT_OWNED_KEYS
+            )
+            content = document.as_string()
+        if content == existing_content:
+            return
+    if content is None:
+        content = tomlkit.dumps(values)
+
+    if existing_content is None:
+        # Nothing to protect from a partial write; a plain write also gives the
+        # new file the default umask permissions
+        _ = pyproject_path.write_text(content, encoding="utf-8")
+        return
+
+    with NamedTemporaryFile(
+        "w",
+        encoding="utf-8",
+        dir=repo_path,
+        prefix=f".{pyproject_path.name}.",
+        suffix=".tmp",
+        delete=False,
+    ) as tmp_file:
+        _ = tmp_file.write(content)
+    tmp_path = Path(tmp_file.name)
+    try:
+        # The temporary file is created 0600; keep the user's original mode
+        shutil.copymode(pyproject_path, tmp_path)
+        _ = tmp_path.replace(pyproject_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _iter_python_files(root: Path) -> Iterator[Path]:
+    """Yield Python files under a directory, in the same order as rglob("*.py").
+
+    Uses an os.scandir walk that builds a Path only for ``.py`` files and
+    prunes ``__pycache__`` and hidden directories (``.venv``, ``.mypy_cache``),
+    which cannot hold importable modules. Symlinked directories are not
+    followed and unreadable directories are skipped, as with rglob.
+
+    Args:
+        root: Directory to search.
+
+    Yields:
+        Paths of ``.py`` files, each directory's files before its subdirectories.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirs: list[Path] = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name != "__pycache__" and not entry.name.startswith("."):
+                    subdirs.append(directory / entry.name)
+            elif entry.name.endswith(".py"):
+                yield directory / entry.name
+        # Reversed so the first subdirectory is popped, and walked, first
+        stack.extend(reversed(subdirs))
 
 
 def _is_typer_app_file(py_file: Path) -> bool:
@@ -656,8 +799,9 @@ def _is_typer_app_file(py_file: Path) -> bool:
     try:
         content = py_file.read_text(encoding="utf-8")
 
-        # Quick text check first (optimization)
-        if "typer" not in content.lower() or "Typer(" not in content:
+        # Quick text check first (optimization). Any file containing "Typer(" also
+        # contains "typer" case-insensitively, so no lowercased copy is needed.
+        if "Typer(" not in content:
             return False
 
         # Parse AST to check for Typer app instantiation
@@ -715,7 +859,7 @@ def detect_typer_cli_module(repo_path: Path, pyproject: PyprojectConfig) -> list
         repo_path / "src" / package_name,
         repo_path / package_name,
     ]
-    source_paths = [p for p in potential_paths if p.exists() and p.is_dir()]
+    source_paths = [p for p in potential_paths if p.is_dir()]
 
     if not source_paths:
         return []
@@ -725,7 +869,7 @@ def detect_typer_cli_module(repo_path: Path, pyproject: PyprojectConfig) -> list
 
     # Search for Python files with Typer app
     for source_path in source_paths:
-        for py_file in source_path.rglob("*.py"):
+        for py_file in _iter_python_files(source_path):
             # Skip test files
             if "test" in py_file.name or py_file.name.startswith("test_"):
                 continue
@@ -757,6 +901,10 @@ def detect_private_registry(pyproject: PyprojectConfig) -> tuple[bool, str | Non
     return False, None
 
 
+# Ruff rule selectors enabled for documented projects, in insertion order
+_DOCSTRING_RUFF_RULES = ("DOC", "D")
+
+
 def update_ruff_config(pyproject: PyprojectConfig) -> PyprojectConfig:
     """Add docstring linting rules to ruff configuration.
 
@@ -787,15 +935,40 @@ def update_ruff_config(pyproject: PyprojectConfig) -> PyprojectConfig:
     )
     lint["select"] = select
 
-    # Add docstring rules if not present
-    if "DOC" not in select:
-        select.append("DOC")
-    if "D" not in select:
-        select.append("D")
+    # Add docstring rules if not present, checking membership against a set
+    # since users may already select dozens of rules
+    selected = set(select)
+    select.extend(rule for rule in _DOCSTRING_RUFF_RULES if rule not in selected)
 
     return pyproject
 
 
+@lru_cache(maxsize=1)
+def _jinja_env() -> Environment:
+    """Get the shared Jinja2 environment used for all template rendering.
+
+    Returns:
+        Jinja2 environment preserving trailing newlines with autoescaping.
+    """
+    # Deferred import - only setup renders templates, so build/serve/validate skip Jinja2
+    from jinja2 import Environment  # noqa: PLC0415
+
+    return Environment(keep_trailing_newline=True, autoescape=True)
+
+
+@lru_cache(maxsize=16)
+def _get_template(source: str) -> Template:
+    """Compile a template source once per process.
+
+    Args:
+        source: Jinja2 template source text.
+
+    Returns:
+        Compiled template from the shared environment.
+    """
+    return _jinja_env().from_string(source)
+
+
 def create_mkdocs_config(
     repo_path: Path,
     project_name: str,
@@ -825,8 +998,7 @@ def create_mkdocs_config(
     Raises:
         CLIError: If existing YAML cannot be parsed or merge fails
     """
-    env = Environment(keep_trailing_newline=True, autoescape=True)
-    template = env.from_string(MKDOCS_YML_TEMPLATE)
+    template = _get_template(MKDOCS_YML_TEMPLATE)
 
     # Convert absolute Path objects to relative string paths for template
     c_source_dirs_relative = [
@@ -878,24 +1050,39 @@ def create_mkdocs_config(
     return is_first_run
 
 
-def _is_pages_job(job: dict[str, object]) -> bool:
-    """Check if a job is a GitHub Pages deployment job.
+def _scan_job_steps(job: dict[str, object]) -> tuple[bool, bool]:
+    """Scan a job's steps once for Pages deployment and mkapidocs usage.
 
     Args:
         job: Job dictionary.
 
     Returns:
-        True if job is a Pages deployment job.
+        Tuple of (uses actions/deploy-pages, runs mkapidocs).
     """
-    # Check steps for actions/deploy-pages
+    deploys_pages = False
+    runs_mkapidocs = False
     steps: list[object] = cast("list[object]", job.get("steps", []))
     for step in steps:
-        if isinstance(step, dict) and "uses" in step:
-            uses = str(step["uses"])
-            if "actions/deploy-pages" in uses:
-                return True
+        if not isinstance(step, dict):
+            continue
+        if not deploys_pages and "uses" in step:
+            deploys_pages = "actions/deploy-pages" in str(step["uses"])
+        if not runs_mkapidocs and "run" in step:
+            runs_mkapidocs = "mkapidocs" in str(step["run"])
+        if deploys_pages and runs_mkapidocs:
+            break
+    return deploys_pages, runs_mkapidocs
+
+
+def _has_pages_environment(job: dict[str, object]) -> bool:
+    """Check if a job targets the GitHub Pages environment.
+
+    Args:
+        job: Job dictionary.
 
-    # Check environment
+    Returns:
+        True if the job's environment is github-pages.
+    """
     environment = job.get("environment")
     env_name = ""
     if isinstance(environment, dict):
@@ -907,24 +1094,6 @@ def _is_pages_job(job: dict[str, object]) -> bool:
     return env_name == "github-pages" or env_name.startswith("github-pages")
 
 
-def _uses_mkapidocs(job: dict[str, object]) -> bool:
-    """Check if a job uses mkapidocs.
-
-    Args:
-        job: Job dictionary.
-
-    Returns:
-        True if job uses mkapidocs.
-    """
-    steps: list[object] = cast("list[object]", job.get("steps", []))
-    for step in steps:
-        if isinstance(step, dict) and "run" in step:
-            run_cmd = str(step["run"])
-            if "mkapidocs" in run_cmd:
-                return True
-    return False
-
-
 def _check_existing_github_workflow(workflow_file: Path) -> bool:
     """Check if a GitHub workflow file already handles Pages deployment.
 
@@ -948,8 +1117,9 @@ def _check_existing_github_workflow(workflow_file: Path) -> bool:
         # Cast job to dict[str, object] for helper functions
         job_dict = cast("dict[str, object]", job)
 
-        if _is_pages_job(job_dict):
-            if _uses_mkapidocs(job_dict):
+        deploys_pages, runs_mkapidocs = _scan_job_steps(job_dict)
+        if deploys_pages or _has_pages_environment(job_dict):
+            if runs_mkapidocs:
                 console.print(
                     f"[green]Found existing pages deployment job '{job_name}' in '{workflow_file.name}' using mkapidocs.[/green]"
                 )
@@ -1168,8 +1338,7 @@ def create_index_page(
     if index_path.exists():
         return
 
-    env = Environment(keep_trailing_newline=True, autoescape=True)
-    template = env.from_string(INDEX_MD_TEMPLATE)
+    template = _get_template(INDEX_MD_TEMPLATE)
 
     content = template.render(
         project_name=project_name,
@@ -1202,23 +1371,22 @@ def create_api_reference(
     generated_dir = repo_path / "docs" / "generated"
     generated_dir.mkdir(parents=True, exist_ok=True)
 
-    env = Environment(keep_trailing_newline=True, autoescape=True)
     package_name = project_name.replace("-", "_")
 
     # Python API
-    python_template = env.from_string(PYTHON_API_MD_TEMPLATE)
+    python_template = _get_template(PYTHON_API_MD_TEMPLATE)
     python_content = python_template.render(package_name=package_name)
     _ = (generated_dir / "python-api.md").write_text(python_content)
 
     # C API - only create if C/C++ source directories detected
     if c_source_dirs:
-        c_template = env.from_string(C_API_MD_TEMPLATE)
+        c_template = _get_template(C_API_MD_TEMPLATE)
         c_content = c_template.render(project_name=project_name)
         _ = (generated_dir / "c-api.md").write_text(c_content)
 
     # CLI - create a separate file for each CLI module detected
     if cli_modules:
-        cli_template = env.from_string(CLI_MD_TEMPLATE)
+        cli_template = _get_template(CLI_MD_TEMPLATE)
         for cli_module in cli_modules:
             # Extract a friendly name from the module path for the filename
             # e.g., "package.cli" -> "cli", "package.tool2.main" -> "tool2-main"
@@ -1426,8 +1594,6 @@ def create_supporting_docs(
     docs_dir = repo_path / "docs"
     docs_dir.mkdir(exist_ok=True)
 
-    env = Environment(keep_trailing_newline=True, autoescape=True)
-
     requires_python = pyproject.project.requires_python or "3.11+"
 
     if git_url is None:
@@ -1453,7 +1619,7 @@ def create_supporting_docs(
     # Create install.md (only if doesn't exist - preserve user customizations)
     install_path = docs_dir / "install.md"
     if not install_path.exists():
-        install_template = env.from_string(INSTALL_MD_TEMPLATE)
+        install_template = _get_template(INSTALL_MD_TEMPLATE)
         install_content = install_template.render(**template_context)
         _ = install_path.write_text(install_content)
 
@@ -1595,7 +1761,8 @@ def _detect_provider_and_url(
             raise ValueError(
                 "Could not auto-detect GitHub URL from git remote. Please provide --site-url option."
             )
-        return provider, github_url_base.rstrip("/")
+        # Detected bases always end in exactly one slash, so drop just that
+        return provider, github_url_base.removesuffix("/")
 
     # GitLab provider
     return provider, _detect_gitlab_site_url(repo_path)
@@ -1709,35 +1876,52 @@ def setup_documentation(
     elif provider == CIProvider.GITLAB:
         create_gitlab_ci(repo_path)
 
-    create_index_page(
-        repo_path,
-        project_name,
-        description,
-        c_source_dirs_list,
-        has_typer_cli,
-        license_name,
-        has_private_registry,
-        private_registry_url,
-    )
-    create_api_reference(repo_path, project_name, c_source_dirs_list, cli_modules)
-    create_generated_content(
-        repo_path,
-        project_name,
-        c_source_dirs_list,
-        cli_modules,
-        has_private_registry,
-        private_registry_url,
-        pyproject.has_scripts,
-    )
-    create_supporting_docs(
-        repo_path,
-        project_name,
-        pyproject,
-        c_source_dirs_list,
-        has_typer_cli,
-        final_site_url,
-        git_url=None,
-    )
+    # The docs pages are independent, silent file writes on separate paths, so
+    # they are rendered and written concurrently. Steps that print progress stay
+    # sequential above to keep console output ordered.
+    futures = [
+        get_executor().submit(
+            create_index_page,
+            repo_path,
+            project_name,
+            description,
+            c_source_dirs_list,
+            has_typer_cli,
+            license_name,
+            has_private_registry,
+            private_registry_url,
+        ),
+        get_executor().submit(
+            create_api_reference,
+            repo_path,
+            project_name,
+            c_source_dirs_list,
+            cli_modules,
+        ),
+        get_executor().submit(
+            create_generated_content,
+            repo_path,
+            project_name,
+            c_source_dirs_list,
+            cli_modules,
+            has_private_registry,
+            private_registry_url,
+            pyproject.has_scripts,
+        ),
+        get_executor().submit(
+            create_supporting_docs,
+            repo_path,
+            project_name,
+            pyproject,
+            c_source_dirs_list,
+            has_typer_cli,
+            final_site_url,
+            git_url=None,
+        ),
+    ]
+    # Re-raise the first failure, as the sequential calls would have
+    for future in futures:
+        future.result()
 
     update_gitignore(repo_path, provider)
 
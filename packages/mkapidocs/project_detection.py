@@ -10,18 +10,30 @@ from __future__ import annotations
 import os
 import subprocess
 from contextlib import suppress
-from pathlib import Path
+from functools import lru_cache
 from shutil import which
+from typing import TYPE_CHECKING
 
 import tomlkit
 
 from mkapidocs.console import console
 from mkapidocs.models import PyprojectConfig
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# File extensions that mark a directory as containing C/C++ sources
+_C_EXTENSIONS = frozenset({".c", ".h", ".cpp", ".hpp", ".cc", ".hh"})
+
 
 def read_pyproject(repo_path: Path) -> PyprojectConfig:
     """Read and parse pyproject.toml into typed configuration.
 
+    Parsed results are cached on the file's content so the validators and
+    generator share one parse of an unchanged file, while any edit is seen
+    regardless of timestamps; callers receive a deep copy they are free to
+    mutate.
+
     Args:
         repo_path: Path to repository.
 
@@ -32,16 +44,39 @@ def read_pyproject(repo_path: Path) -> PyprojectConfig:
         FileNotFoundError: If pyproject.toml does not exist.
     """
     pyproject_path = repo_path / "pyproject.toml"
-    if not pyproject_path.exists():
-        raise FileNotFoundError(f"pyproject.toml not found in {repo_path}")
+    try:
+        content = pyproject_path.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"pyproject.toml not found in {repo_path}") from None
+
+    return _parse_pyproject_cached(content).model_copy(deep=True)
+
+
+@lru_cache(maxsize=8)
+def _parse_pyproject_cached(content: bytes) -> PyprojectConfig:
+    """Parse pyproject.toml content, memoized on the raw bytes.
+
+    Keying on the bytes rather than the file's stat signature means a hit
+    requires identical content, so edits within the filesystem's timestamp
+    granularity or with a restored mtime are never missed.
+
+    Args:
+        content: Raw pyproject.toml content
 
-    with Path(pyproject_path).open(encoding="utf-8") as f:
-        raw_data = tomlkit.load(f)
+    Returns:
+        Parsed and validated pyproject.toml configuration.
+    """
+    raw_data = tomlkit.parse(content.decode("utf-8"))
 
     return PyprojectConfig.from_dict(raw_data)
 
 
-def _contains_c_files(dir_path: Path, c_extensions: set[str]) -> bool:
+def clear_pyproject_cache() -> None:
+    """Drop all memoized read_pyproject() results."""
+    _parse_pyproject_cached.cache_clear()
+
+
+def _contains_c_files(dir_path: Path, c_extensions: frozenset[str]) -> bool:
     """Check if directory contains any C/C++ source files.
 
     Args:
@@ -50,12 +85,29 @@ def _contains_c_files(dir_path: Path, c_extensions: set[str]) -> bool:
 
     Returns:
         True if directory contains at least one file with a C/C++ extension.
+        False for missing paths and non-directories.
     """
-    return any(file_path.suffix in c_extensions for file_path in dir_path.rglob("*"))
+    # Iterative os.scandir walk: stops at the first hit without building a
+    # Path object per entry. Like rglob, symlinked directories are not
+    # followed and unreadable directories are skipped.
+    stack = [os.fspath(dir_path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    # Same rule as Path.suffix: a leading dot is not a suffix
+                    dot = entry.name.rfind(".")
+                    if dot > 0 and entry.name[dot:] in c_extensions:
+                        return True
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except OSError:
+            continue
+    return False
 
 
 def _detect_c_code_from_explicit(
-    repo_path: Path, explicit_dirs: list[str], c_extensions: set[str]
+    repo_path: Path, explicit_dirs: list[str], c_extensions: frozenset[str]
 ) -> list[Path]:
     """Detect C code from explicit CLI arguments.
 
@@ -70,17 +122,13 @@ def _detect_c_code_from_explicit(
     found_dirs: list[Path] = []
     for dir_str in explicit_dirs:
         dir_path = (repo_path / dir_str).resolve()
-        if (
-            dir_path.exists()
-            and dir_path.is_dir()
-            and _contains_c_files(dir_path, c_extensions)
-        ):
+        if _contains_c_files(dir_path, c_extensions):
             found_dirs.append(dir_path)
     return found_dirs
 
 
 def _detect_c_code_from_env(
-    repo_path: Path, env_dirs: str, c_extensions: set[str]
+    repo_path: Path, env_dirs: str, c_extensions: frozenset[str]
 ) -> list[Path]:
     """Detect C code from environment variable.
 
@@ -95,17 +143,13 @@ def _detect_c_code_from_env(
     found_dirs: list[Path] = []
     for dir_str in env_dirs.split(":"):
         dir_path = (repo_path / dir_str.strip()).resolve()
-        if (
-            dir_path.exists()
-            and dir_path.is_dir()
-            and _contains_c_files(dir_path, c_extensions)
-        ):
+        if _contains_c_files(dir_path, c_extensions):
             found_dirs.append(dir_path)
     return found_dirs
 
 
 def _detect_c_code_from_config(
-    repo_path: Path, pyproject: PyprojectConfig, c_extensions: set[str]
+    repo_path: Path, pyproject: PyprojectConfig, c_extensions: frozenset[str]
 ) -> list[Path]:
     """Detect C code from pypis_delivery_service config.
 
@@ -143,7 +187,9 @@ def _detect_c_code_from_config(
     return []
 
 
-def _detect_c_code_from_git(repo_path: Path, c_extensions: set[str]) -> list[Path]:
+def _detect_c_code_from_git(
+    repo_path: Path, c_extensions: frozenset[str]
+) -> list[Path]:
     """Detect C code via git ls-files.
 
     Args:
@@ -159,32 +205,32 @@ def _detect_c_code_from_git(repo_path: Path, c_extensions: set[str]) -> list[Pat
     with suppress(
         subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError
     ):
+        # Let git filter by extension so output scales with the number of C/C++
+        # files rather than with the size of the whole repository
         result = subprocess.run(
-            [git_cmd, "ls-files"],
+            [git_cmd, "ls-files", "--", *(f"*{ext}" for ext in sorted(c_extensions))],
             cwd=repo_path,
             capture_output=True,
             text=True,
             check=True,
             timeout=10,
         )
-        # Find unique directories containing C/C++ files
-        c_dirs: set[Path] = set()
-        for line in result.stdout.strip().split("\n"):
-            if not line:
-                continue
-            file_path = Path(line)
-            if file_path.suffix in c_extensions and len(file_path.parts) > 1:
-                # Get the top-level directory of this file
-                c_dirs.add(repo_path / file_path.parts[0])
+        # Find unique top-level directories containing C/C++ files; files at the
+        # repository root have no directory part and are ignored
+        c_dirs: set[Path] = {
+            repo_path / top_dir
+            for top_dir, sep, _ in (
+                line.partition("/") for line in result.stdout.splitlines()
+            )
+            if sep
+        }
 
         if c_dirs:
             # Verify directories exist and contain C/C++ files
             found_dirs: list[Path] = [
                 dir_path
                 for dir_path in sorted(c_dirs)
-                if dir_path.exists()
-                and dir_path.is_dir()
-                and _contains_c_files(dir_path, c_extensions)
+                if _contains_c_files(dir_path, c_extensions)
             ]
             return found_dirs
     return []
@@ -213,7 +259,7 @@ def detect_c_code(
         List of absolute Path objects to directories containing C/C++ code.
         Empty list if no C/C++ code found.
     """
-    c_extensions = {".c", ".h", ".cpp", ".hpp", ".cc", ".hh"}
+    c_extensions = _C_EXTENSIONS
 
     # Priority 1: Explicit CLI option
     if explicit_dirs:
@@ -241,11 +287,7 @@ def detect_c_code(
 
     # Priority 5: Fallback to source/ directory
     source_dir = repo_path / "source"
-    if (
-        source_dir.exists()
-        and source_dir.is_dir()
-        and _contains_c_files(source_dir, c_extensions)
-    ):
+    if _contains_c_files(source_dir, c_extensions):
         return [source_dir.resolve()]
 
     return []
@@ -261,4 +303,5 @@ def detect_typer_dependency(pyproject: PyprojectConfig) -> bool:
         True if typer found in dependencies.
     """
     dependencies = pyproject.project.dependencies
-    return any(dep.strip().lower().startswith("typer") for dep in dependencies)
+    # Lowercase only the 5-char prefix rather than each full requirement string
+    return any(dep.lstrip()[:5].lower() == "typer" for dep in dependencies)
@@ -0,0 +1,28 @@
+"""Shared worker threads for mkapidocs.
+
+Provides a single lazily created thread pool so the validators and the
+generator reuse warm worker threads instead of each starting their own.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# Enough for the largest fan-out (the four docs pages written during setup)
+_MAX_WORKERS = 4
+
+
+@lru_cache(maxsize=1)
+def get_executor() -> ThreadPoolExecutor:
+    """Get the shared thread pool, creating it on first use.
+
+    Callers submit work and wait on their own futures; they must not shut the
+    pool down. Tasks running on the pool must not wait on other tasks submitted
+    to it, since a saturated pool would deadlock. concurrent.futures joins the
+    worker threads at interpreter exit.
+
+    Returns:
+        The process-wide ThreadPoolExecutor.
+    """
+    return ThreadPoolExecutor(max_workers=_MAX_WORKERS, thread_name_prefix="mkapidocs")
@@ -8,14 +8,12 @@ from .index_md_template import INDEX_MD_TEMPLATE
 from .install_md_template import INSTALL_MD_TEMPLATE
 from .python_api_md_template import PYTHON_API_MD_TEMPLATE
 
-# Load static templates using modern importlib.resources.files() API
-GITHUB_ACTIONS_PAGES_TEMPLATE = (
-    files("mkapidocs.templates").joinpath("pages.yml").read_text()
-)
-GITLAB_CI_PAGES_TEMPLATE = (
-    files("mkapidocs.templates").joinpath("gitlab-ci.yml").read_text()
-)
-MKDOCS_YML_TEMPLATE = files("mkapidocs.templates").joinpath("mkdocs.yml.j2").read_text()
+# Load static templates using modern importlib.resources.files() API,
+# resolving the package resource directory once for all three reads
+_TEMPLATE_DIR = files(__name__)
+GITHUB_ACTIONS_PAGES_TEMPLATE = _TEMPLATE_DIR.joinpath("pages.yml").read_text()
+GITLAB_CI_PAGES_TEMPLATE = _TEMPLATE_DIR.joinpath("gitlab-ci.yml").read_text()
+MKDOCS_YML_TEMPLATE = _TEMPLATE_DIR.joinpath("mkdocs.yml.j2").read_text()
 
 __all__ = [
     "CLI_MD_TEMPLATE",
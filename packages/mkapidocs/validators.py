@@ -9,24 +9,25 @@ import shutil
 import subprocess
 import sys
 import tarfile
+import tomllib
 from dataclasses import dataclass
 from pathlib import Path
 from shutil import which
 from typing import TYPE_CHECKING, ClassVar, TypedDict, cast
 
-import httpx
-import tomlkit
 from rich import box
 from rich.console import Console
-from rich.measure import Measurement
+from rich.emoji import Emoji
 from rich.table import Table
-from tomlkit.exceptions import TOMLKitError
+from rich.text import Text
 
+from mkapidocs.console import get_rendered_width
 from mkapidocs.project_detection import (
     detect_c_code,
     detect_typer_dependency,
     read_pyproject,
 )
+from mkapidocs.runtime import get_executor
 
 if TYPE_CHECKING:
     from mkapidocs.models import PyprojectConfig
@@ -34,8 +35,21 @@ if TYPE_CHECKING:
 # Initialize Rich console for local output
 console = Console()
 
+# Status icon and detail style for a failed check, keyed on ValidationResult.required.
+# Emoji codes are resolved once here so table cells can be plain Text (no markup parsing).
+_FAILURE_STATUS: dict[bool, tuple[str, str]] = {
+    True: (Emoji.replace(":x:"), "red"),
+    False: (Emoji.replace(":warning:"), "yellow"),
+}
 
-@dataclass
+# Doxygen release asset pattern per platform.system(), for x86_64/amd64 machines only.
+_DOXYGEN_X86_64_ASSETS: dict[str, str] = {
+    "linux": "doxygen-*.linux.bin.tar.gz",
+    "windows": "doxygen-*-setup.exe",
+}
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result of a validation check.
 
@@ -75,6 +89,8 @@ class DoxygenInstaller:
     )
     CACHE_DIR: ClassVar[Path] = Path.home() / ".cache" / "doxygen-binaries"
     INSTALL_DIR: ClassVar[Path] = Path.home() / ".local" / "bin"
+    # 1 MiB chunks need far fewer f.write() calls than the previous 8 KiB chunks
+    DOWNLOAD_CHUNK_SIZE: ClassVar[int] = 1 << 20
 
     @classmethod
     def is_installed(cls) -> tuple[bool, str | None]:
@@ -112,23 +128,15 @@ class DoxygenInstaller:
         Returns:
             Asset name pattern to match, or None if platform not supported
         """
-        system = platform.system().lower()
-        machine = platform.machine().lower()
+        # macOS is absent from the table: it requires Homebrew, can't auto-install DMG
+        asset_name = _DOXYGEN_X86_64_ASSETS.get(platform.system().lower())
+        if asset_name is None:
+            return None
 
-        match system:
-            case "linux":
-                if "x86_64" in machine or "amd64" in machine:
-                    return "doxygen-*.linux.bin.tar.gz"
-                return None
-            case "windows":
-                if "x86_64" in machine or "amd64" in machine:
-                    return "doxygen-*-setup.exe"
-                return None
-            case "darwin":
-                # macOS requires Homebrew, can't auto-install DMG
-                return None
-            case _:
-                return None
+        machine = platform.machine().lower()
+        if "x86_64" in machine or "amd64" in machine:
+            return asset_name
+        return None
 
     @classmethod
     def _get_unsupported_platform_message(cls) -> tuple[bool, str]:
@@ -155,6 +163,8 @@ class DoxygenInstaller:
         Raises:
             httpx.HTTPError: If the request fails
         """
+        import httpx  # noqa: PLC0415
+
         console.print("[blue]Fetching Doxygen release information...[/blue]")
         with httpx.Client(timeout=30.0) as client:
             response = client.get(cls.GITHUB_API_URL)
@@ -193,6 +203,8 @@ class DoxygenInstaller:
         Raises:
             httpx.HTTPError: If download fails
         """
+        import httpx  # noqa: PLC0415
+
         console.print(f"[blue]Downloading {asset_name}...[/blue]")
 
         cls.CACHE_DIR.mkdir(parents=True, exist_ok=True)
@@ -204,7 +216,7 @@ class DoxygenInstaller:
         ):
             _ = dl_response.raise_for_status()
             with download_path.open("wb") as f:
-                for chunk in dl_response.iter_bytes(chunk_size=8192):
+                for chunk in dl_response.iter_bytes(chunk_size=cls.DOWNLOAD_CHUNK_SIZE):
                     _ = f.write(chunk)
 
         console.print(f"[green]Downloaded to {download_path}[/green]")
@@ -221,6 +233,10 @@ class DoxygenInstaller:
         if asset_pattern is None:
             return cls._get_unsupported_platform_message()
 
+        # httpx is only needed on this rarely taken path; importing it lazily
+        # keeps it off every CLI invocation's startup
+        import httpx  # noqa: PLC0415
+
         try:
             release_data = cls._fetch_release_data()
             asset = cls._find_matching_asset(release_data, asset_pattern)
@@ -241,6 +257,32 @@ class DoxygenInstaller:
 
         return (False, "Downloaded, but automatic installation only supported on Linux")
 
+    @staticmethod
+    def _find_extracted_binary(extract_dir: Path) -> Path | None:
+        """Find the doxygen binary in an extracted release tree.
+
+        Iterative depth-first scan with os.scandir that stops at the first match,
+        avoiding the per-directory tuple building of os.walk.
+
+        Args:
+            extract_dir: Directory the release tarball was extracted into
+
+        Returns:
+            Path to the doxygen binary, or None if not present
+
+        Raises:
+            OSError: If a directory in the tree cannot be read
+        """
+        stack = [os.fspath(extract_dir)]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.name == "doxygen" and entry.is_file():
+                        return Path(entry.path)
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        return None
+
     @classmethod
     def _install_linux_binary(cls, tarball_path: Path) -> tuple[bool, str]:
         """Extract and install Linux Doxygen binary.
@@ -265,14 +307,8 @@ class DoxygenInstaller:
                 else:
                     tar.extractall(extract_dir)  # noqa: S202
 
-            # Find doxygen binary in extracted files
-            doxygen_bin = None
-            for root, _dirs, files in os.walk(extract_dir):
-                if "doxygen" in files:
-                    doxygen_bin = Path(root) / "doxygen"
-                    break
-
-            if not doxygen_bin or not doxygen_bin.exists():
+            doxygen_bin = cls._find_extracted_binary(extract_dir)
+            if doxygen_bin is None:
                 return False, "Could not find doxygen binary in extracted archive"
 
             # Copy to install directory
@@ -296,6 +332,50 @@ class DoxygenInstaller:
 class SystemValidator:
     """Validates system-level requirements."""
 
+    # Version probe output keyed by (binary_path, st_mtime_ns, version_arg).
+    # Upgrading or reinstalling a binary changes its mtime, so stale entries are never hit.
+    _version_cache: ClassVar[dict[tuple[str, int, str], str]] = {}
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Discard all memoized version probe results."""
+        cls._version_cache.clear()
+
+    @classmethod
+    def _probe_version(cls, path: str, version_arg: str) -> str:
+        """Run a binary's version command, memoized on the binary's mtime.
+
+        Args:
+            path: Absolute path to the binary.
+            version_arg: Argument to get version.
+
+        Returns:
+            Stripped stdout of the version command.
+
+        Raises:
+            subprocess.CalledProcessError: If the version command fails.
+            subprocess.TimeoutExpired: If the version command hangs.
+        """
+        try:
+            cache_key: tuple[str, int, str] | None = (
+                path,
+                Path(path).stat().st_mtime_ns,
+                version_arg,
+            )
+        except OSError:
+            cache_key = None
+
+        if cache_key is not None and cache_key in cls._version_cache:
+            return cls._version_cache[cache_key]
+
+        result = subprocess.run(
+            [path, version_arg], capture_output=True, text=True, check=True, timeout=5
+        )
+        version = result.stdout.strip()
+        if cache_key is not None:
+            cls._version_cache[cache_key] = version
+        return version
+
     @staticmethod
     def _check_command(
         name: str,
@@ -323,14 +403,7 @@ class SystemValidator:
             )
 
         try:
-            result = subprocess.run(
-                [path, version_arg],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=5,
-            )
-            version = result.stdout.strip()
+            version = SystemValidator._probe_version(path, version_arg)
             if strip_prefix and version.startswith(strip_prefix):
                 version = version[len(strip_prefix) :]
             return ValidationResult(
@@ -481,17 +554,18 @@ class ProjectValidator:
                 required=True,
             )
 
-        # Try to parse it
+        # Only parseability matters here, so use the C-accelerated stdlib parser
+        # rather than tomlkit's format-preserving document model
         try:
-            with Path(pyproject_path).open(encoding="utf-8") as f:
-                _ = tomlkit.load(f)
+            with Path(pyproject_path).open("rb") as f:
+                _ = tomllib.load(f)
             return ValidationResult(
                 check_name="pyproject.toml",
                 passed=True,
                 message="Valid TOML file",
                 required=True,
             )
-        except TOMLKitError as e:
+        except tomllib.TOMLDecodeError as e:
             return ValidationResult(
                 check_name="pyproject.toml",
                 passed=False,
@@ -591,20 +665,6 @@ class ProjectValidator:
         )
 
 
-def _get_table_width(table: Table) -> int:
-    """Get the natural width of a table using a temporary wide console.
-
-    Args:
-        table: The Rich table to measure
-
-    Returns:
-        The width in characters needed to display the table
-    """
-    temp_console = Console(width=9999)
-    measurement = Measurement.get(temp_console, temp_console.options, table)
-    return int(measurement.maximum)
-
-
 def display_validation_results(
     results: list[ValidationResult], title: str = "Environment Validation"
 ) -> None:
@@ -637,24 +697,47 @@ def display_validation_results(
     table.add_column("Version/Info", style="magenta", no_wrap=True)
 
     for result in failures:
-        # Determine status icon using emoji tokens
-        status = ":x:" if result.required else ":warning:"
-        status_style = "red" if result.required else "yellow"
-
-        # Format details with color
-        details = f"[{status_style}]{result.message}[/{status_style}]"
-
-        # Add row
-        table.add_row(result.check_name, status, details, result.value or "")
+        status, status_style = _FAILURE_STATUS[result.required]
+        table.add_row(
+            Text(result.check_name),
+            Text(status),
+            Text(result.message, style=status_style),
+            Text(result.value or ""),
+        )
 
     # Set table width to natural size
-    table_width = _get_table_width(table)
+    table_width = get_rendered_width(table)
     table.width = table_width
 
     # Display table
     console.print(table, crop=False, overflow="ignore", no_wrap=True, soft_wrap=True)
 
 
+def _auto_install_doxygen() -> ValidationResult | None:
+    """Install Doxygen for a project with C/C++ code and re-check it.
+
+    Returns:
+        Fresh Doxygen validation result if installation succeeded, None otherwise.
+    """
+    # Related lines go out in one print call so Rich renders and writes them once
+    console.print(
+        "\n[yellow]C/C++ code detected but Doxygen not installed.[/yellow]\n"
+        "[blue]Attempting automatic Doxygen installation...[/blue]\n"
+    )
+
+    success, message = DoxygenInstaller.download_and_install()
+
+    if not success:
+        console.print(
+            f"\n[yellow]:warning: {message}[/yellow]\n\n"
+            "[yellow]Documentation will be generated without C/C++ API reference.[/yellow]\n"
+        )
+        return None
+
+    console.print(f"\n[green]:white_check_mark: {message}[/green]\n")
+    return SystemValidator.check_doxygen()
+
+
 def validate_environment(
     repo_path: Path, check_mkdocs: bool = False, auto_install_doxygen: bool = False
 ) -> tuple[bool, list[ValidationResult]]:
@@ -668,60 +751,52 @@ def validate_environment(
     Returns:
         Tuple of (all_required_passed, list of results)
     """
-    results: list[ValidationResult] = []
-
-    # System checks
+    # System checks each wait on a version probe subprocess, so they run on worker
+    # threads while the project checks below proceed on this one
     sys_validator = SystemValidator()
-    results.extend((sys_validator.check_git(), sys_validator.check_uv()))
-    doxygen_result = sys_validator.check_doxygen()
-    results.append(doxygen_result)
+    executor = get_executor()
+    system_futures = [
+        executor.submit(sys_validator.check_git),
+        executor.submit(sys_validator.check_uv),
+        executor.submit(sys_validator.check_doxygen),
+    ]
 
     # Project checks
     proj_validator = ProjectValidator(repo_path)
     path_result = proj_validator.check_path_exists()
-    results.append(path_result)
+    project_results = [path_result]
 
     # Only continue with further checks if path exists
+    c_code_result: ValidationResult | None = None
     if path_result.passed:
-        results.extend((
+        project_results.extend((
             proj_validator.check_git_repository(),
             proj_validator.check_pyproject_toml(),
         ))
         c_code_result = proj_validator.check_c_code()
-        results.extend((c_code_result, proj_validator.check_typer_dependency()))
+        project_results.extend((c_code_result, proj_validator.check_typer_dependency()))
 
         if check_mkdocs:
-            results.append(proj_validator.check_mkdocs_yml())
-
-        # Auto-install Doxygen if needed
-        if (
-            auto_install_doxygen
-            and c_code_result.passed
-            and c_code_result.value
-            and "required" in c_code_result.value.lower()
-            and not doxygen_result.passed
-        ):
-            console.print(
-                "\n[yellow]C/C++ code detected but Doxygen not installed.[/yellow]"
-            )
-            console.print("[blue]Attempting automatic Doxygen installation...[/blue]\n")
-
-            success, message = DoxygenInstaller.download_and_install()
-
-            if success:
-                # Re-check Doxygen
-                doxygen_result = sys_validator.check_doxygen()
-                # Update the result in the list
-                for i, r in enumerate(results):
-                    if r.check_name == "Doxygen":
-                        results[i] = doxygen_result
-                        break
-                console.print(f"\n[green]:white_check_mark: {message}[/green]\n")
-            else:
-                console.print(f"\n[yellow]:warning: {message}[/yellow]\n")
-                console.print(
-                    "[yellow]Documentation will be generated without C/C++ API reference.[/yellow]\n"
-                )
+            project_results.append(proj_validator.check_mkdocs_yml())
+
+    # Results keep the fixed system-then-project order
+    results = [future.result() for future in system_futures]
+
+    # Remember the Doxygen row so a post-install re-check can replace it
+    doxygen_index = len(results) - 1
+    doxygen_result = results[doxygen_index]
+    results.extend(project_results)
+
+    # Auto-install Doxygen if needed
+    needs_doxygen = (
+        c_code_result is not None
+        and c_code_result.passed
+        and "required" in (c_code_result.value or "").lower()
+    )
+    if auto_install_doxygen and not doxygen_result.passed and needs_doxygen:
+        installed_result = _auto_install_doxygen()
+        if installed_result is not None:
+            results[doxygen_index] = installed_result
 
     # Check if all required checks passed
     all_required_passed = all(r.passed or not r.required for r in results)
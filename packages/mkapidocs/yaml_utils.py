@@ -6,21 +6,23 @@ across the codebase. All YAML operations should go through this module.
 
 from __future__ import annotations
 
+import copy
 import re
 from contextlib import suppress
 from dataclasses import dataclass
+from functools import lru_cache
 from io import StringIO
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, TypeAlias, cast
 
-from rich import box
 from rich.console import Console
-from rich.measure import Measurement
-from rich.table import Table
+from rich.emoji import Emoji
+from rich.text import Text
 from ruamel.yaml import YAML
 from ruamel.yaml.comments import CommentedMap, CommentedSeq
 from ruamel.yaml.error import YAMLError
 from ruamel.yaml.scalarstring import LiteralScalarString, ScalarString
-from ruamel.yaml.util import load_yaml_guess_indent
+
+from mkapidocs.console import get_rendered_width
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -33,10 +35,79 @@ _COMMENT_POST_VALUE_INDEX = 2
 # Initialize Rich console
 console = Console()
 
+# Action cells for the change table, keyed on FileChange.action.
+# Built once as styled Text so rows skip Rich's markup parser.
+_ACTION_LABELS: dict[str, Text] = {
+    action: Text.assemble((Emoji.replace(":white_check_mark:"), "green"), f" {label}")
+    for action, label in (("updated", "Updated"), ("added", "Added"))
+}
+
+# Prefix trie of template-owned key paths. Each level maps a key to its child
+# trie; a None value marks the key (and its whole subtree) as template-owned.
+_OwnedKeyTrie: TypeAlias = "dict[str, _OwnedKeyTrie | None]"
+_EMPTY_OWNED_KEY_TRIE: _OwnedKeyTrie = {}
+
+# Template-owned keys for mkdocs.yml
+# Note: markdown_extensions and theme.palette are NOT template-owned because:
+# 1. Users often customize them (colors, icons, custom_fences)
+# 2. They can contain Python tags that can't be safely round-tripped
+# 3. Replacing deeply nested structures loses comment/blank-line metadata
+_BASE_TEMPLATE_OWNED_KEYS = frozenset({
+    "plugins.gen-files.scripts",
+    "plugins.search",
+    "plugins.mkdocstrings",
+    "plugins.mermaid2",
+    "plugins.termynal",
+    "plugins.literate-nav",
+    "theme.name",
+})
+# Owned only when the rendered template provides a value for them
+_OPTIONAL_TEMPLATE_OWNED_KEYS = ("site_url", "repo_url")
+
+# Python object tags (e.g. !!python/name:material.extensions.emoji.twemoji)
+# that the safe loader cannot construct; swapped for a placeholder string.
+_PYTHON_NAME_TAG_RE = re.compile(r"!!python/name:\S+", re.ASCII)
+
+
+def _safe_yaml() -> YAML:
+    """Create a safe YAML instance for read-only parsing.
+
+    A YAML instance keeps per-load parser state, so each call gets its own
+    rather than sharing one across the worker threads that setup and
+    validation run on.
+
+    Returns:
+        Configured ruamel.yaml safe-loading instance
+    """
+    return YAML(typ="safe")
+
+
+def _round_trip_yaml(mapping: int, sequence: int, offset: int) -> YAML:
+    """Create a round-trip YAML instance with the given indentation.
+
+    The round-trip loader keeps the pure Python parser and emitter: the
+    libyaml CParser/CEmitter do not carry comment tokens, so attaching them
+    would silently strip user comments from mkdocs.yml.
+
+    Args:
+        mapping: Spaces per nesting level for mappings
+        sequence: Spaces for content within sequence items
+        offset: Spaces before the sequence dash
+
+    Returns:
+        Configured ruamel.yaml round-trip instance
+    """
+    yaml = YAML()
+    yaml.preserve_quotes = True
+    yaml.indent(mapping=mapping, sequence=sequence, offset=offset)
+    return yaml
+
+
 # Re-export YAMLError for consumers that need to catch it
 __all__ = [
     "YAMLError",
     "append_to_yaml_list",
+    "clear_yaml_cache",
     "load_yaml",
     "load_yaml_preserve_format",
     "merge_mkdocs_yaml",
@@ -55,9 +126,8 @@ def load_yaml(content: str) -> dict[str, object] | None:
     Returns:
         Parsed dictionary or None if content is not a valid dict
     """
-    yaml = YAML(typ="safe")
     with suppress(YAMLError):
-        data = yaml.load(content)
+        data = _safe_yaml().load(content)
         if isinstance(data, dict):
             return cast("dict[str, object]", data)
     return None
@@ -66,7 +136,10 @@ def load_yaml(content: str) -> dict[str, object] | None:
 def load_yaml_from_path(path: Path) -> dict[str, object] | None:
     """Load YAML file for read-only access.
 
-    Convenience wrapper around load_yaml() for file paths.
+    Convenience wrapper around load_yaml() for file paths. Parsed results are
+    cached on the file's content, as read_pyproject() does, so repeated reads
+    of an unchanged file skip parsing while any edit is seen regardless of
+    timestamps; callers receive a deep copy they are free to mutate.
 
     Args:
         path: Path to YAML file
@@ -74,12 +147,30 @@ def load_yaml_from_path(path: Path) -> dict[str, object] | None:
     Returns:
         Parsed dictionary or None if file doesn't exist or isn't valid YAML dict
     """
-    if not path.exists():
+    try:
+        content = path.read_bytes()
+    except OSError:
         return None
-    with suppress(OSError):
-        content = path.read_text(encoding="utf-8")
-        return load_yaml(content)
-    return None
+    data = _load_yaml_cached(content)
+    return copy.deepcopy(data) if data is not None else None
+
+
+@lru_cache(maxsize=64)
+def _load_yaml_cached(content: bytes) -> dict[str, object] | None:
+    """Parse YAML file content, memoized on the raw bytes.
+
+    Args:
+        content: Raw YAML file content
+
+    Returns:
+        Parsed dictionary or None if content isn't a valid YAML dict
+    """
+    return load_yaml(content.decode("utf-8"))
+
+
+def clear_yaml_cache() -> None:
+    """Drop all memoized load_yaml_from_path() results."""
+    _load_yaml_cached.cache_clear()
 
 
 def load_yaml_preserve_format(
@@ -108,13 +199,7 @@ def load_yaml_preserve_format(
 
     indent_settings = _detect_yaml_indentation(content)
 
-    yaml = YAML()
-    yaml.preserve_quotes = True
-    yaml.indent(
-        mapping=indent_settings[0],
-        sequence=indent_settings[1],
-        offset=indent_settings[2],
-    )
+    yaml = _round_trip_yaml(*indent_settings)
 
     try:
         data = yaml.load(content)
@@ -126,11 +211,67 @@ def load_yaml_preserve_format(
     return None, default_indent
 
 
+def _leading_spaces(line: str) -> int:
+    """Count the spaces at the start of a line.
+
+    Args:
+        line: Line of YAML text
+
+    Returns:
+        Number of leading space characters
+    """
+    return len(line) - len(line.lstrip(" "))
+
+
+def _guess_yaml_indent(content: str) -> tuple[int | None, int | None]:
+    """Guess the indent and block sequence indent of YAML text.
+
+    A port of the text scan in ruamel.yaml.util.load_yaml_guess_indent. The
+    utility itself always round-trip loads the document as well, and only
+    accepts a replacement loader from ruamel.yaml 0.18.11 on.
+
+    Args:
+        content: YAML file content as string
+
+    Returns:
+        Tuple of (indent, block_seq_indent). indent is the column of sequence
+        item content relative to the parent key, or the nested mapping indent
+        when there are no block sequences. block_seq_indent is the number of
+        spaces before a dash relative to the parent key, or None without block
+        sequences. Either is None when it cannot be determined.
+    """
+    map_indent: int | None = None
+    block_seq_indent: int | None = None
+    prev_line_key_only: int | None = None
+    key_indent = 0
+    for line in content.splitlines():
+        rline = line.rstrip()
+        lline = rline.lstrip()
+        if lline.startswith("- "):
+            dash = _leading_spaces(line)
+            block_seq_indent = dash - key_indent
+            # rline is non-blank after the dash, so the item content exists
+            item = dash + 1 + _leading_spaces(rline[dash + 1 :])
+            if rline[item] == "#":  # comment after the dash
+                continue
+            return item - key_indent, block_seq_indent
+        if map_indent is None and prev_line_key_only is not None and rline:
+            idx = len(line) - len(line.lstrip(" -"))
+            if idx > prev_line_key_only:
+                map_indent = idx - prev_line_key_only
+        if rline.endswith(":"):
+            key_indent = prev_line_key_only = _leading_spaces(line)
+            continue
+        prev_line_key_only = None
+    return map_indent, block_seq_indent
+
+
 def _detect_yaml_indentation(content: str) -> tuple[int, int, int]:
-    """Detect indentation settings from YAML content using ruamel.yaml.
+    """Detect indentation settings from YAML content.
 
-    Uses ruamel.yaml's official load_yaml_guess_indent utility to determine
-    the indentation style used in the file.
+    Uses the same text scan as ruamel.yaml's load_yaml_guess_indent utility,
+    without the round-trip load it finishes with: every caller parses the
+    content itself with its own configured loader.
 
     Args:
         content: YAML file content as string
@@ -138,9 +279,9 @@ def _detect_yaml_indentation(content: str) -> tuple[int, int, int]:
     Returns:
         Tuple of (mapping_indent, sequence_indent, offset) for ruamel.yaml.indent()
     """
-    _, indent, block_seq_indent = load_yaml_guess_indent(content)
+    indent, block_seq_indent = _guess_yaml_indent(content)
 
-    # load_yaml_guess_indent returns:
+    # _guess_yaml_indent returns:
     # - indent: total indentation for sequence item content (from parent to content after dash)
     # - block_seq_indent: spaces before the dash (the offset from parent to dash)
     #
@@ -250,35 +391,21 @@ class CLIError(Exception):
     """Base exception for CLI errors."""
 
 
-@dataclass
+@dataclass(slots=True)
 class FileChange:
     """Record of a change made to a configuration file.
 
     Attributes:
         key_path: Dot-separated path to the key (e.g., "theme.name")
         action: Type of change (updated, added, preserved)
-        old_value: Previous value (None if newly added)
-        new_value: New value (None if preserved)
+        old_value: Previous value (None if newly added); stringified on display
+        new_value: New value (None if preserved); stringified on display
     """
 
     key_path: str
     action: str  # "updated", "added", "preserved"
-    old_value: str | None = None
-    new_value: str | None = None
-
-
-def _get_table_width(table: Table) -> int:
-    """Get the natural width of a table using a temporary wide console.
-
-    Args:
-        table: The Rich table to measure.
-
-    Returns:
-        The width in characters needed to display the table.
-    """
-    temp_console = Console(width=9999)
-    measurement = Measurement.get(temp_console, temp_console.options, table)
-    return int(measurement.maximum)
+    old_value: object | None = None
+    new_value: object | None = None
 
 
 def display_file_changes(file_path: Path, changes: list[FileChange]) -> None:
@@ -298,6 +425,11 @@ def display_file_changes(file_path: Path, changes: list[FileChange]) -> None:
     if not actual_changes:
         return
 
+    # Table rendering is only needed when something changed, so keep it off
+    # the import path of callers that merely load or merge YAML
+    from rich import box  # noqa: PLC0415
+    from rich.table import Table  # noqa: PLC0415
+
     table = Table(
         title=f":page_facing_up: Changes to {file_path.name}",
         box=box.MINIMAL_DOUBLE_HEAD,
@@ -310,40 +442,68 @@ def display_file_changes(file_path: Path, changes: list[FileChange]) -> None:
     table.add_column("New Value", style="green", no_wrap=True)
 
     for change in actual_changes:
-        # Format action with emoji
-        if change.action == "updated":
-            action_display = "[green]:white_check_mark:[/green] Updated"
-        else:  # added
-            action_display = "[green]:white_check_mark:[/green] Added"
-
-        # Format values - no truncation
+        # Values are stored raw and only stringified here - no truncation
         old_val = str(change.old_value) if change.old_value is not None else ""
         new_val = str(change.new_value) if change.new_value is not None else ""
 
-        table.add_row(change.key_path, action_display, old_val, new_val)
+        table.add_row(
+            Text(change.key_path),
+            _ACTION_LABELS[change.action],
+            Text(old_val),
+            Text(new_val),
+        )
 
     # Set table width to natural size and print
-    table_width = _get_table_width(table)
+    table_width = get_rendered_width(table)
     table.width = table_width
     console.print(table, crop=False, overflow="ignore", no_wrap=True, soft_wrap=True)
 
 
-def _is_template_owned_key(current_path: str, template_owned_keys: set[str]) -> bool:
-    """Check if a key path is controlled by the template.
+@lru_cache(maxsize=8)
+def _build_owned_key_trie(owned_keys: frozenset[str]) -> _OwnedKeyTrie:
+    """Build a prefix trie from dot-separated template-owned key paths.
+
+    Cached per owned-key set; callers must treat the returned trie as read-only.
+
+    Args:
+        owned_keys: Dot-separated key paths the template always controls
 
     Returns:
-        True if the current_path matches or is a child of any template-owned key.
+        Nested dict trie where a None value marks an owned key
     """
-    return any(
-        current_path == owned_key or current_path.startswith(owned_key + ".")
-        for owned_key in template_owned_keys
-    )
+    trie: _OwnedKeyTrie = {}
+    for owned_key in owned_keys:
+        node = trie
+        *parents, leaf = owned_key.split(".")
+        for part in parents:
+            child = node.get(part, {})
+            if child is None:
+                # An ancestor is already owned, so this path adds nothing
+                break
+            node[part] = child
+            node = child
+        else:
+            node[leaf] = None
+    return trie
+
+
+def _key_path(path_stack: list[str], key: str) -> str:
+    """Join the parent key stack and a key into a dot-separated path.
+
+    Args:
+        path_stack: Keys of the enclosing mappings, outermost first
+        key: Key at the current level
+
+    Returns:
+        Dot-separated key path (e.g., "theme.name")
+    """
+    return ".".join([*path_stack, str(key)])
 
 
 def _handle_template_owned_key(
     existing_yaml: dict[str, CommentedMap | CommentedSeq | ScalarString],
     key: str,
-    current_path: str,
+    path_stack: list[str],
     existing_value: CommentedSeq | CommentedMap | ScalarString | None,
     template_value: CommentedSeq | CommentedMap | ScalarString,
 ) -> FileChange | None:
@@ -353,17 +513,21 @@ def _handle_template_owned_key(
         FileChange record if value changed, None otherwise.
     """
     change = None
+    # Owned values are scalars or small plugin option maps. Plain == compares
+    # dicts/lists in C already, so serializing both sides first would only add work.
     if existing_value != template_value:
         if existing_value is None:
             change = FileChange(
-                key_path=current_path, action="added", new_value=str(template_value)
+                key_path=_key_path(path_stack, key),
+                action="added",
+                new_value=template_value,
             )
         else:
             change = FileChange(
-                key_path=current_path,
+                key_path=_key_path(path_stack, key),
                 action="updated",
-                old_value=str(existing_value),
-                new_value=str(template_value),
+                old_value=existing_value,
+                new_value=template_value,
             )
     new_value = _preserve_scalar_style(template_value)
     if existing_value is not None:
@@ -375,8 +539,8 @@ def _handle_template_owned_key(
 def _merge_yaml_in_place(
     existing_yaml: dict[str, CommentedMap | CommentedSeq | ScalarString],
     template_yaml: dict[str, CommentedMap | CommentedSeq | ScalarString],
-    template_owned_keys: set[str],
-    key_prefix: str = "",
+    owned_key_trie: _OwnedKeyTrie,
+    path_stack: list[str] | None = None,
     depth: int = 0,
     max_depth: int = 50,
 ) -> list[FileChange]:
@@ -388,8 +552,8 @@ def _merge_yaml_in_place(
     Args:
         existing_yaml: Current YAML content from file (modified in place)
         template_yaml: New YAML content from template
-        template_owned_keys: Set of key paths that template always controls
-        key_prefix: Current key path for recursion (dot-separated)
+        owned_key_trie: Trie of template-owned keys at this nesting level
+        path_stack: Parent keys of this level; joined only when recording a change
         depth: Current recursion depth (internal parameter)
         max_depth: Maximum nesting depth to prevent stack overflow
 
@@ -406,57 +570,71 @@ def _merge_yaml_in_place(
         )
         raise CLIError(msg)
 
+    if path_stack is None:
+        path_stack = []
     changes: list[FileChange] = []
+    append_change = changes.append
+    user_keys = existing_yaml.keys() - template_yaml.keys()
 
     for key, template_value in template_yaml.items():
-        current_path = f"{key_prefix}.{key}" if key_prefix else key
         existing_value = existing_yaml.get(key)
+        owned_subtrie = (
+            owned_key_trie.get(key, _EMPTY_OWNED_KEY_TRIE)
+            if owned_key_trie
+            else _EMPTY_OWNED_KEY_TRIE
+        )
 
-        if _is_template_owned_key(current_path, template_owned_keys):
+        if owned_subtrie is None:
             change = _handle_template_owned_key(
-                existing_yaml, key, current_path, existing_value, template_value
+                existing_yaml, key, path_stack, existing_value, template_value
             )
             if change:
-                changes.append(change)
+                append_change(change)
         elif isinstance(template_value, dict) and isinstance(existing_value, dict):
             existing_dict = existing_value
             template_dict = template_value
+            path_stack.append(key)
             nested_changes = _merge_yaml_in_place(
                 existing_dict,
                 template_dict,
-                template_owned_keys,
-                current_path,
+                owned_subtrie,
+                path_stack,
                 depth + 1,
                 max_depth,
             )
+            path_stack.pop()
             changes.extend(nested_changes)
         elif existing_value is not None:
-            changes.append(
+            append_change(
                 FileChange(
-                    key_path=current_path,
+                    key_path=_key_path(path_stack, key),
                     action="preserved",
-                    old_value=str(existing_value),
+                    old_value=existing_value,
                     new_value=None,
                 )
             )
         else:
+            # New sections are inserted whole - no per-key walk of the subtree
             existing_yaml[key] = _preserve_scalar_style(template_value)
-            template_str = str(template_value) if template_value is not None else ""
-            changes.append(
+            append_change(
                 FileChange(
-                    key_path=current_path, action="added", new_value=template_str
+                    key_path=_key_path(path_stack, key),
+                    action="added",
+                    new_value=template_value if template_value is not None else "",
                 )
             )
 
-    # Record existing keys not in template (user additions) - already preserved, just log them
+    # Record existing keys not in template (user additions) - already preserved, just log them.
+    # The key-view difference runs in C; the rescan below only keeps file order.
+    if not user_keys:
+        return changes
     for key, existing_value in existing_yaml.items():
-        if key not in template_yaml:
-            current_path = f"{key_prefix}.{key}" if key_prefix else key
-            changes.append(
+        if key in user_keys:
+            append_change(
                 FileChange(
-                    key_path=current_path,
+                    key_path=_key_path(path_stack, key),
                     action="preserved",
-                    old_value=str(existing_value),
+                    old_value=existing_value,
                     new_value=None,
                 )
             )
@@ -486,9 +664,7 @@ def merge_mkdocs_yaml(
     mapping_indent, sequence_indent, offset = _detect_yaml_indentation(existing_text)
 
     # Initialize ruamel.yaml with detected indentation
-    yaml = YAML()
-    yaml.preserve_quotes = True
-    yaml.indent(mapping=mapping_indent, sequence=sequence_indent, offset=offset)
+    yaml = _round_trip_yaml(mapping_indent, sequence_indent, offset)
 
     try:
         # ruamel.yaml load returns CommentedMap which acts like a dict
@@ -501,41 +677,26 @@ def merge_mkdocs_yaml(
     template_for_parsing = template_content
     if "!!python/name:" in template_content:
         # Replace Python tags with placeholders for parsing structure
-        template_for_parsing = re.sub(
-            r"!!python/name:\S+", '"__PYTHON_TAG_PLACEHOLDER__"', template_content
+        template_for_parsing = _PYTHON_NAME_TAG_RE.sub(
+            '"__PYTHON_TAG_PLACEHOLDER__"', template_content
         )
 
     try:
         # Use safe_load for template as it's generated by us and we want standard dicts
-        yaml_safe = YAML(typ="safe")
-        template_yaml = yaml_safe.load(template_for_parsing)
+        template_yaml = _safe_yaml().load(template_for_parsing)
     except YAMLError as e:
         msg = f"Failed to parse template YAML: {e}"
         raise CLIError(msg) from e
 
-    # Define template-owned keys for mkdocs.yml
-    # Note: markdown_extensions and theme.palette are NOT template-owned because:
-    # 1. Users often customize them (colors, icons, custom_fences)
-    # 2. They can contain Python tags that can't be safely round-tripped
-    # 3. Replacing deeply nested structures loses comment/blank-line metadata
-    template_owned_keys = {
-        "plugins.gen-files.scripts",
-        "plugins.search",
-        "plugins.mkdocstrings",
-        "plugins.mermaid2",
-        "plugins.termynal",
-        "plugins.literate-nav",
-        "theme.name",
-    }
-
     # Add site_url and repo_url if template provides them
-    if template_yaml.get("site_url"):
-        template_owned_keys.add("site_url")
-    if template_yaml.get("repo_url"):
-        template_owned_keys.add("repo_url")
+    template_owned_keys = _BASE_TEMPLATE_OWNED_KEYS | frozenset(
+        key for key in _OPTIONAL_TEMPLATE_OWNED_KEYS if template_yaml.get(key)
+    )
 
     # Merge in place to preserve ruamel.yaml's CommentedMap formatting
-    changes = _merge_yaml_in_place(existing_yaml, template_yaml, template_owned_keys)
+    changes = _merge_yaml_in_place(
+        existing_yaml, template_yaml, _build_owned_key_trie(template_owned_keys)
+    )
 
     # Dump the modified CommentedMap - preserves original indentation and structure
     stream = StringIO()
@@ -627,9 +788,7 @@ def append_to_yaml_list(file_path: Path, key: str, value: str | dict[str, str])
     # Detect and preserve original indentation style
     mapping_indent, sequence_indent, offset = _detect_yaml_indentation(content)
 
-    yaml = YAML()
-    yaml.preserve_quotes = True
-    yaml.indent(mapping=mapping_indent, sequence=sequence_indent, offset=offset)
+    yaml = _round_trip_yaml(mapping_indent, sequence_indent, offset)
 
     raw_config = yaml.load(content)
 
@@ -658,7 +817,7 @@ def append_to_yaml_list(file_path: Path, key: str, value: str | dict[str, str])
         # Single entry - convert to list while preserving the original entry
         raw_config[key] = CommentedSeq([existing_value, item_to_append])
 
-    stream = StringIO()
-    yaml.dump(raw_config, stream)
-    _ = file_path.write_text(stream.getvalue(), encoding="utf-8")
+    # Emit UTF-8 straight to the file rather than building an intermediate string
+    with file_path.open("wb") as stream:
+        yaml.dump(raw_config, stream)
     return True
@@ -13,6 +13,9 @@ from typing import TYPE_CHECKING
 import pytest
 
 from mkapidocs.models import PyprojectConfig, TomlTable
+from mkapidocs.project_detection import clear_pyproject_cache
+from mkapidocs.validators import SystemValidator
+from mkapidocs.yaml_utils import clear_yaml_cache
 
 if TYPE_CHECKING:
     from collections.abc import Generator
@@ -50,6 +53,26 @@ def mkapidocs_module() -> ModuleType:
     return sys.modules["mkapidocs"]
 
 
+@pytest.fixture(autouse=True)
+def clear_validator_caches() -> Generator[None, None, None]:
+    """Reset memoized validator results between tests.
+
+    Tests: Validator cache isolation
+    How: Clear SystemValidator version cache and parsed YAML and TOML caches around each test
+    Why: Mocked which()/subprocess results and parsed files must not leak into later tests
+
+    Yields:
+        None
+    """
+    SystemValidator.clear_cache()
+    clear_yaml_cache()
+    clear_pyproject_cache()
+    yield
+    SystemValidator.clear_cache()
+    clear_yaml_cache()
+    clear_pyproject_cache()
+
+
 @pytest.fixture
 def mock_repo_path(tmp_path: Path) -> Path:
     """Create a mock repository directory structure.
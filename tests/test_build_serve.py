@@ -5,18 +5,26 @@ Tests cover:
 - serve_docs(): MkDocs serve integration with custom host/port
 - is_mkapidocs_in_target_env(): Check if mkapidocs installed in target env
 - Error handling: missing files, missing commands, subprocess failures
+- _kill_process_on_port(): Stopping a server that holds the serve port
 """
+# pyright: reportPrivateUsage=false
 
 from __future__ import annotations
 
 import shutil
+import signal
 import subprocess
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
 
 import pytest
 
-from mkapidocs.builder import build_docs, is_mkapidocs_in_target_env, serve_docs
+from mkapidocs.builder import (
+    _kill_process_on_port,
+    build_docs,
+    is_mkapidocs_in_target_env,
+    serve_docs,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -594,6 +602,45 @@ class TestServeDocs:
         mock_kill.assert_called_once_with(8000)
 
 
+class TestKillProcessOnPort:
+    """Test suite for stopping a server that already holds the serve port."""
+
+    def test_kill_process_on_port_returns_once_process_exits(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test stopping a process does not wait out the full grace period.
+
+        Tests: _kill_process_on_port shutdown wait
+        How: Report one PID from lsof and make it vanish right after SIGINT
+        Why: A server that stops promptly must not delay the new one by a second
+
+        Args:
+            mocker: pytest-mock fixture for mocking
+        """
+        # Arrange
+        mocker.patch("mkapidocs.builder.which", return_value="/usr/bin/lsof")
+        lsof_result = MagicMock(returncode=0, stdout="4242\n")
+        mocker.patch("mkapidocs.builder.subprocess.run", return_value=lsof_result)
+        signals: list[tuple[int, int]] = []
+
+        def fake_kill(pid: int, sig: int) -> None:
+            signals.append((pid, sig))
+            if sig == 0:
+                raise ProcessLookupError
+
+        mocker.patch("mkapidocs.builder.os.kill", side_effect=fake_kill)
+        mock_sleep = mocker.patch("mkapidocs.builder.time.sleep")
+        mocker.patch("mkapidocs.builder.console.print")
+
+        # Act
+        killed = _kill_process_on_port(8000)
+
+        # Assert
+        assert killed is True
+        assert signals == [(4242, signal.SIGINT), (4242, 0)]
+        mock_sleep.assert_not_called()
+
+
 class TestIsMkapidocsInTargetEnv:
     """Test suite for is_mkapidocs_in_target_env function.
 
@@ -22,12 +22,12 @@ if TYPE_CHECKING:
     from typer import Typer
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def cli_runner() -> CliRunner:
     """Provide Typer CLI test runner.
 
     Tests: CLI command execution
-    How: Create CliRunner instance from typer.testing
+    How: Create one stateless CliRunner instance from typer.testing per module
     Why: Enables CLI testing without invoking subprocess
 
     Returns:
@@ -36,12 +36,12 @@ def cli_runner() -> CliRunner:
     return CliRunner()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def typer_app() -> Typer:
     """Extract Typer app from mkapidocs module.
 
     Tests: CLI app instance access
-    How: Get app attribute from shared mkapidocs module loaded in conftest
+    How: Get app attribute from shared mkapidocs module loaded in conftest, once per module
     Why: Ensures all tests use the same Typer app instance
 
     Returns:
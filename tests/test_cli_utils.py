@@ -15,8 +15,8 @@ from mkapidocs.cli import (
     _validate_provider,
     console,
 )
-from mkapidocs.generator import console as generator_console
-from mkapidocs.models import CIProvider
+from mkapidocs.generator import console as generator_console, display_message
+from mkapidocs.models import CIProvider, MessageType
 from mkapidocs.validators import console as validators_console
 from mkapidocs.yaml_utils import console as yaml_console
 
@@ -107,3 +107,19 @@ def test_generate_success_message(mock_repo_path: Path) -> None:
     assert str(mock_repo_path.name) in msg
     assert "uv run mkapidocs serve" in msg
     assert ".github/" in msg
+
+
+def test_display_message_title_is_literal_text() -> None:
+    """Test panel titles render as given rather than as Rich markup."""
+    with generator_console.capture() as capture:
+        display_message("body", MessageType.WARNING, title="Use [bold]--flag[/bold]")
+
+    assert "Use [bold]--flag[/bold]" in capture.get()
+
+
+def test_display_message_defaults_title_to_message_type() -> None:
+    """Test the message type supplies the title when none is given."""
+    with generator_console.capture() as capture:
+        display_message("body", MessageType.ERROR)
+
+    assert "Error" in capture.get()
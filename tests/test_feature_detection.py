@@ -10,20 +10,25 @@ Tests cover:
 
 from __future__ import annotations
 
+import subprocess
+from shutil import which
 from typing import TYPE_CHECKING
 
 import pytest
 
 from mkapidocs.generator import (
     GitLabPagesResult,
+    _parse_git_remote,
     detect_c_code,
+    detect_ci_provider,
     detect_github_url_base,
     detect_private_registry,
     detect_typer_cli_module,
     detect_typer_dependency,
+    get_git_remote_url,
     query_gitlab_pages_url,
 )
-from mkapidocs.models import ProjectConfig, PyprojectConfig
+from mkapidocs.models import CIProvider, ProjectConfig, PyprojectConfig
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -177,6 +182,138 @@ class TestGitHubURLDetection:
         assert result is None
 
 
+class TestGitRemoteParsing:
+    """Test suite for git remote URL parsing.
+
+    Tests the _parse_git_remote helper shared by GitHub and GitLab detection.
+    """
+
+    @pytest.mark.parametrize(
+        ("remote_url", "expected"),
+        [
+            ("git@github.com:owner/repo.git", ("github.com", "owner", "repo")),
+            ("git@gitlab.com:group/sub/repo", ("gitlab.com", "group/sub", "repo")),
+            ("https://github.com/owner/repo.git", ("github.com", "owner", "repo")),
+            (
+                "https://token@gitlab.com/group/sub/repo",
+                ("gitlab.com", "group/sub", "repo"),
+            ),
+            ("git@github.com:repo.git", None),
+            ("file:///srv/repo.git", None),
+        ],
+    )
+    def test_parse_git_remote_formats(
+        self, remote_url: str, expected: tuple[str, str, str] | None
+    ) -> None:
+        """Test SSH and HTTPS remotes split into host, namespace, and project.
+
+        Tests: _parse_git_remote handles SSH, HTTPS, nested groups, and bad input
+        How: Parametrized test over remote URL shapes
+        Why: Pages URL detection depends on the parsed namespace and project
+
+        Args:
+            remote_url: Git remote URL to parse
+            expected: Expected (host, namespace, project) or None
+        """
+        # Act
+        result = _parse_git_remote(remote_url)
+
+        # Assert
+        assert result == expected
+
+    def test_get_git_remote_url_reads_first_url_line(
+        self, mock_repo_path: Path
+    ) -> None:
+        """Test the first url line is taken from a CRLF config with several remotes.
+
+        Tests: get_git_remote_url config scan
+        How: Write a .git/config with CRLF endings, an empty url, and two remotes
+        Why: The config is scanned in one regex search rather than line by line
+
+        Args:
+            mock_repo_path: Temporary repository directory
+        """
+        # Arrange
+        git_dir = mock_repo_path / ".git"
+        git_dir.mkdir()
+        (git_dir / "config").write_bytes(
+            b"[core]\r\n\tbare = false\r\n\turl =\r\n"
+            b'[remote "origin"]\r\n\turl = git@github.com:owner/repo.git\r\n'
+            b'[remote "fork"]\r\n\turl = https://github.com/me/repo.git\r\n'
+        )
+
+        # Act
+        result = get_git_remote_url(mock_repo_path)
+
+        # Assert
+        assert result == "git@github.com:owner/repo.git"
+
+    def test_get_git_remote_url_prefers_origin(self, mock_repo_path: Path) -> None:
+        """Test the origin remote wins over remotes listed before it.
+
+        Tests: get_git_remote_url origin preference
+        How: Write a .git/config listing an upstream remote ahead of origin
+        Why: Pages URLs must come from the project's own remote, not a fork source
+
+        Args:
+            mock_repo_path: Temporary repository directory
+        """
+        # Arrange
+        git_dir = mock_repo_path / ".git"
+        git_dir.mkdir()
+        (git_dir / "config").write_text(
+            '[remote "upstream"]\n'
+            "\turl = https://github.com/upstream/repo.git\n"
+            '[remote "origin"]\n'
+            "\tfetch = +refs/heads/*:refs/remotes/origin/*\n"
+            "\turl = git@github.com:owner/repo.git\n"
+        )
+
+        # Act
+        result = get_git_remote_url(mock_repo_path)
+
+        # Assert
+        assert result == "git@github.com:owner/repo.git"
+
+
+class TestCIProviderDetection:
+    """Test suite for CI provider detection from the git remote."""
+
+    @pytest.mark.parametrize(
+        ("remote_url", "expected"),
+        [
+            ("git@github.com:owner/repo.git", CIProvider.GITHUB),
+            ("https://gitlab.example.com/group/repo.git", CIProvider.GITLAB),
+            ("https://gitlab.com/group/github-mirror.git", CIProvider.GITHUB),
+            ("https://mygithubhost.com/owner/repo.git", None),
+        ],
+    )
+    def test_detect_ci_provider_from_remote(
+        self, mock_repo_path: Path, remote_url: str, expected: CIProvider | None
+    ) -> None:
+        """Test provider words in the remote URL select the provider.
+
+        Tests: detect_ci_provider remote URL strategy
+        How: Write a .git/config origin URL and detect with no CI files present
+        Why: Enterprise hosts are recognized by whole-word matches, GitHub first
+
+        Args:
+            mock_repo_path: Temporary repository directory
+            remote_url: Origin URL to write
+            expected: Provider expected from the URL, or None
+        """
+        # Arrange
+        git_dir = mock_repo_path / ".git"
+        git_dir.mkdir()
+        (git_dir / "config").write_text(f'[remote "origin"]\n\turl = {remote_url}\n')
+
+        # Act
+        result = detect_ci_provider(mock_repo_path)
+
+        # Assert
+        assert result == expected
+
+
 class TestCCodeDetection:
     """Test suite for C/C++ code detection in repository.
 
@@ -201,6 +338,80 @@ class TestCCodeDetection:
         assert len(result) == 1
         assert result[0] == mock_c_code_repo / "source"
 
+    @pytest.mark.skipif(which("git") is None, reason="git not installed")
+    def test_detect_c_code_from_tracked_files(self, mock_repo_path: Path) -> None:
+        """Test C code detection via git reports top-level dirs of tracked C files.
+
+        Tests: detect_c_code git ls-files detection
+        How: Track C files in two top-level dirs, plus root-level and Python files
+        Why: git filters by extension, so only C/C++ paths reach the parser
+
+        Args:
+            mock_repo_path: Temporary repository directory
+        """
+        # Arrange
+        for relative in ("lib/core/impl.cpp", "include/api.h", "root.c", "pkg/mod.py"):
+            file_path = mock_repo_path / relative
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_text("")
+        subprocess.run(["git", "init", "-q"], cwd=mock_repo_path, check=True)
+        subprocess.run(["git", "add", "."], cwd=mock_repo_path, check=True)
+
+        # Act
+        result = detect_c_code(mock_repo_path)
+
+        # Assert
+        assert result == [mock_repo_path / "include", mock_repo_path / "lib"]
+
+    def test_detect_c_code_finds_nested_files_only(self, mock_repo_path: Path) -> None:
+        """Test C code detection walks subdirectories and ignores dotfiles.
+
+        Tests: detect_c_code scans nested directories for C/C++ suffixes
+        How: Place one header deep in an explicit dir, and only a ".c" dotfile in another
+        Why: The directory walk must match Path.suffix semantics at any depth
+
+        Args:
+            mock_repo_path: Temporary repository directory
+        """
+        # Arrange
+        nested = mock_repo_path / "lib" / "a" / "b"
+        nested.mkdir(parents=True)
+        (nested / "api.hh").write_text("")
+        dotfile_dir = mock_repo_path / "misc"
+        dotfile_dir.mkdir()
+        (dotfile_dir / ".c").write_text("")
+
+        # Act
+        result = detect_c_code(mock_repo_path, explicit_dirs=["lib", "misc"])
+
+        # Assert
+        assert result == [(mock_repo_path / "lib").resolve()]
+
+    def test_detect_c_code_skips_missing_and_file_paths(
+        self, mock_repo_path: Path
+    ) -> None:
+        """Test explicit paths that are missing or are files are ignored.
+
+        Tests: detect_c_code explicit directory filtering
+        How: Pass a missing path, a C file path, and a real C directory
+        Why: The directory walk itself rejects non-directories without extra stats
+
+        Args:
+            mock_repo_path: Temporary repository directory
+        """
+        # Arrange
+        lib = mock_repo_path / "lib"
+        lib.mkdir()
+        (lib / "api.c").write_text("")
+
+        # Act
+        result = detect_c_code(
+            mock_repo_path, explicit_dirs=["absent", "lib/api.c", "lib"]
+        )
+
+        # Assert
+        assert result == [lib.resolve()]
+
     def test_detect_c_code_with_cpp_files(self, mock_repo_path: Path) -> None:
         """Test C code detection when .cpp files present.
 
@@ -473,6 +684,32 @@ class TestTyperCLIModuleDetection:
         # Assert
         assert result == []
 
+    def test_detect_typer_cli_module_walks_nested_and_prunes_hidden(
+        self, mock_typer_cli_repo: Path, mock_pyproject_with_typer: PyprojectConfig
+    ) -> None:
+        """Test nested CLI modules are found while hidden and cache dirs are skipped.
+
+        Tests: detect_typer_cli_module source walk
+        How: Copy the CLI module into a subpackage, a .venv dir, and __pycache__
+        Why: The scandir walk must match rglob order but never descend into tool dirs
+
+        Args:
+            mock_typer_cli_repo: Repository with Typer CLI
+            mock_pyproject_with_typer: Parsed pyproject with Typer
+        """
+        # Arrange
+        package_dir = mock_typer_cli_repo / "test_cli_project"
+        cli_source = (package_dir / "cli.py").read_text()
+        for subdir in ("tools", ".venv", "__pycache__"):
+            (package_dir / subdir).mkdir()
+            (package_dir / subdir / "main.py").write_text(cli_source)
+
+        # Act
+        result = detect_typer_cli_module(mock_typer_cli_repo, mock_pyproject_with_typer)
+
+        # Assert
+        assert result == ["test_cli_project.cli", "test_cli_project.tools.main"]
+
     def test_detect_typer_cli_module_skips_test_files(
         self, mock_repo_path: Path, mock_pyproject_with_typer: PyprojectConfig
     ) -> None:
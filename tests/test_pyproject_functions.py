@@ -9,11 +9,15 @@ Tests cover:
 
 from __future__ import annotations
 
+import os
+import stat
 import tomllib
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 
+from mkapidocs import project_detection
 from mkapidocs.generator import read_pyproject, update_ruff_config, write_pyproject
 
 # Import Pydantic models for test assertions
@@ -22,6 +26,9 @@ from mkapidocs.models import ProjectConfig, PyprojectConfig
 
 # Wrappers removed, using direct imports
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
 
 class TestReadPyproject:
     """Test suite for read_pyproject function."""
@@ -57,6 +64,85 @@ class TestReadPyproject:
         with pytest.raises(FileNotFoundError, match=r"pyproject.toml not found"):
             read_pyproject(mock_repo_path)
 
+    def test_read_pyproject_reuses_parse_for_unchanged_file(
+        self, mock_pyproject_toml: Path, mocker: MockerFixture
+    ) -> None:
+        """Test repeated reads of an unchanged file parse it only once.
+
+        Tests: read_pyproject memoization
+        How: Read the same file twice while spying on tomlkit.parse
+        Why: Validators and the generator each read pyproject.toml during one run
+
+        Args:
+            mock_pyproject_toml: Mock pyproject.toml file path
+            mocker: pytest-mock fixture for spying
+        """
+        # Arrange
+        spy = mocker.spy(project_detection.tomlkit, "parse")
+
+        # Act
+        first = read_pyproject(mock_pyproject_toml.parent)
+        second = read_pyproject(mock_pyproject_toml.parent)
+
+        # Assert
+        assert spy.call_count == 1
+        assert second == first
+
+    def test_read_pyproject_returns_independent_copies(
+        self, mock_pyproject_toml: Path
+    ) -> None:
+        """Test callers cannot corrupt the cached parse by mutating results.
+
+        Tests: read_pyproject copy semantics
+        How: Update the ruff config of one result, then read again
+        Why: update_ruff_config mutates the tool table in place
+
+        Args:
+            mock_pyproject_toml: Mock pyproject.toml file path
+        """
+        # Arrange
+        first = read_pyproject(mock_pyproject_toml.parent)
+
+        # Act
+        _ = update_ruff_config(first)
+        second = read_pyproject(mock_pyproject_toml.parent)
+
+        # Assert
+        assert "ruff" in first.tool
+        assert "ruff" not in second.tool
+
+    def test_read_pyproject_reparses_after_file_change(
+        self, mock_pyproject_toml: Path
+    ) -> None:
+        """Test edits to the file invalidate the cached parse.
+
+        Tests: read_pyproject cache key
+        How: Rewrite the file with a same-size new version and restore its mtime
+        Why: Stale configuration must never be returned after an edit, even one
+            the file's size and timestamps do not reveal
+
+        Args:
+            mock_pyproject_toml: Mock pyproject.toml file path
+        """
+        # Arrange
+        original_stat = mock_pyproject_toml.stat()
+        assert read_pyproject(mock_pyproject_toml.parent).project.version == "0.1.0"
+        content = mock_pyproject_toml.read_text(encoding="utf-8").replace(
+            "0.1.0", "0.2.0"
+        )
+
+        # Act
+        mock_pyproject_toml.write_text(content, encoding="utf-8")
+        os.utime(
+            mock_pyproject_toml,
+            ns=(original_stat.st_atime_ns, original_stat.st_mtime_ns),
+        )
+        result = read_pyproject(mock_pyproject_toml.parent)
+
+        # Assert
+        assert mock_pyproject_toml.stat().st_size == original_stat.st_size
+        assert result.project.version == "0.2.0"
+
 
 class TestWritePyproject:
     """Test suite for write_pyproject function."""
@@ -92,11 +178,11 @@ class TestWritePyproject:
     def test_write_pyproject_overwrites_existing(
         self, mock_pyproject_toml: Path
     ) -> None:
-        """Test writing pyproject.toml overwrites existing file.
+        """Test writing pyproject.toml updates the existing file's values.
 
-        Tests: write_pyproject replaces existing configuration
+        Tests: write_pyproject updates existing configuration
         How: Write new config over existing mock pyproject.toml
-        Why: Update operation should replace entire file
+        Why: Changed values must land in the file even though it is updated in place
 
         Args:
             mock_pyproject_toml: Existing mock pyproject.toml
@@ -116,6 +202,127 @@ class TestWritePyproject:
         assert written_config["project"]["name"] == "updated-project"
         assert written_config["project"]["version"] == "2.0.0"
 
+    def test_write_pyproject_skips_unchanged_content(
+        self, mock_repo_path: Path
+    ) -> None:
+        """Test rewriting identical configuration leaves the file untouched.
+
+        Tests: write_pyproject unchanged-content short circuit
+        How: Write the same config twice with a sentinel mtime in between
+        Why: Re-running setup should not churn the file or editor caches
+
+        Args:
+            mock_repo_path: Temporary repository directory
+        """
+        # Arrange
+        config = PyprojectConfig(project=ProjectConfig(name="same", version="1.0.0"))
+        write_pyproject(mock_repo_path, config)
+        pyproject_path = mock_repo_path / "pyproject.toml"
+        os.utime(pyproject_path, ns=(1_000_000_000, 1_000_000_000))
+
+        # Act
+        write_pyproject(mock_repo_path, config)
+
+        # Assert
+        assert pyproject_path.stat().st_mtime_ns == 1_000_000_000
+        assert sorted(p.name for p in mock_repo_path.iterdir()) == ["pyproject.toml"]
+
+    def test_write_pyproject_preserves_untouched_content(
+        self, mock_pyproject_toml: Path
+    ) -> None:
+        """Test writing an updated config only changes the affected values.
+
+        Tests: write_pyproject in-place tomlkit update
+        How: Add ruff rules to a commented pyproject.toml and compare the text
+        Why: Comments, formatting and unmodelled tables belong to the user
+
+        Args:
+            mock_pyproject_toml: Existing mock pyproject.toml
+        """
+        # Arrange
+        original = (
+            "# Project metadata\n"
+            "[project]\n"
+            'name = "test-project"  # package name\n'
+            'version = "0.1.0"\n'
+            'readme = "README.md"\n'
+            "\n"
+            "[build-system]\n"
+            'requires = ["hatchling"]\n'
+        )
+        mock_pyproject_toml.write_text(original, encoding="utf-8")
+        config = update_ruff_config(read_pyproject(mock_pyproject_toml.parent))
+
+        # Act
+        write_pyproject(mock_pyproject_toml.parent, config)
+
+        # Assert
+        content = mock_pyproject_toml.read_text(encoding="utf-8")
+        assert content.startswith(original)
+        with Path(mock_pyproject_toml).open("rb") as f:
+            assert tomllib.load(f)["tool"]["ruff"]["lint"]["select"] == ["DOC", "D"]
+
+    def test_write_pyproject_removes_dropped_keys(
+        self, mock_pyproject_toml: Path
+    ) -> None:
+        """Test keys the configuration no longer holds are removed from the file.
+
+        Tests: write_pyproject removal of modelled keys
+        How: Drop description and a ruff setting from a read config, write it back
+        Why: The in-place update must not resurrect values the model removed
+
+        Args:
+            mock_pyproject_toml: Existing mock pyproject.toml
+        """
+        # Arrange
+        mock_pyproject_toml.write_text(
+            "[project]\n"
+            'name = "test-project"\n'
+            'description = "old"\n'
+            'readme = "README.md"\n'
+            "\n"
+            "[tool.ruff.lint]\n"
+            'select = ["E"]\n'
+            'ignore = ["E501"]\n',
+            encoding="utf-8",
+        )
+        config = read_pyproject(mock_pyproject_toml.parent)
+        config.project.description = None
+        ruff = config.tool["ruff"]
+        assert isinstance(ruff, dict)
+        del ruff["lint"]["ignore"]
+
+        # Act
+        write_pyproject(mock_pyproject_toml.parent, config)
+
+        # Assert
+        with Path(mock_pyproject_toml).open("rb") as f:
+            written_config = tomllib.load(f)
+        assert "description" not in written_config["project"]
+        assert written_config["project"]["readme"] == "README.md"
+        assert written_config["tool"]["ruff"]["lint"] == {"select": ["E"]}
+
+    def test_write_pyproject_keeps_file_mode(self, mock_pyproject_toml: Path) -> None:
+        """Test rewriting pyproject.toml keeps its permissions and leaves no temp file.
+
+        Tests: write_pyproject atomic replace
+        How: Set an unusual mode, write a changed config, inspect mode and directory
+        Why: The temporary file is created 0600 and must not change the user's mode
+
+        Args:
+            mock_pyproject_toml: Existing mock pyproject.toml
+        """
+        # Arrange
+        mock_pyproject_toml.chmod(0o640)
+        config = update_ruff_config(read_pyproject(mock_pyproject_toml.parent))
+
+        # Act
+        write_pyproject(mock_pyproject_toml.parent, config)
+
+        # Assert
+        assert stat.S_IMODE(mock_pyproject_toml.stat().st_mode) == 0o640
+        assert not list(mock_pyproject_toml.parent.glob(".pyproject.toml.*"))
+
 
 class TestUpdateRuffConfig:
     """Test suite for update_ruff_config function."""
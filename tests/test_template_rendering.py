@@ -20,6 +20,7 @@ from mkapidocs.generator import (
     create_github_actions,
     create_index_page,
     create_mkdocs_config,
+    setup_documentation,
     update_gitignore,
 )
 from mkapidocs.models import CIProvider
@@ -27,6 +28,8 @@ from mkapidocs.models import CIProvider
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from pytest_mock import MockerFixture
+
 
 class TestCreateMkdocsConfig:
     """Test suite for mkdocs.yml generation.
@@ -1094,3 +1097,42 @@ class TestUpdateGitignore:
         assert "/public/" in content
         assert ".mkdocs_cache/" in content
         assert "docs/generated/" not in content
+
+
+class TestSetupDocumentation:
+    """Test suite for the full setup_documentation flow."""
+
+    def test_setup_documentation_writes_all_docs_pages(
+        self, mock_pyproject_toml: Path, mocker: MockerFixture
+    ) -> None:
+        """Test setup writes every docs page, including the concurrently rendered ones.
+
+        Tests: setup_documentation end-to-end file generation
+        How: Run setup with an explicit provider and site URL, then list outputs
+        Why: The docs pages are written from worker threads and must all land
+
+        Args:
+            mock_pyproject_toml: Mock pyproject.toml file
+            mocker: pytest-mock fixture
+        """
+        # Arrange
+        repo_path = mock_pyproject_toml.parent
+        mocker.patch(
+            "mkapidocs.generator.ensure_mkapidocs_installed", return_value=False
+        )
+
+        # Act
+        result = setup_documentation(
+            repo_path, CIProvider.GITHUB, site_url="https://owner.github.io/repo/"
+        )
+
+        # Assert
+        assert result.is_first_run is True
+        docs_dir = repo_path / "docs"
+        assert (docs_dir / "index.md").is_file()
+        assert (docs_dir / "install.md").is_file()
+        assert sorted(p.name for p in (docs_dir / "generated").iterdir()) == [
+            "index-features.md",
+            "install-command.md",
+            "python-api.md",
+        ]
@@ -9,17 +9,23 @@ Tests cover:
 
 from __future__ import annotations
 
+import os
 import subprocess
+import threading
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import httpx
 
+from mkapidocs.runtime import get_executor
 from mkapidocs.validators import (
     DoxygenInstaller,
     ProjectValidator,
     SystemValidator,
     ValidationResult,
+    console as validators_console,
+    display_validation_results,
+    validate_environment,
 )
 
 if TYPE_CHECKING:
@@ -329,7 +335,7 @@ class TestDoxygenInstaller:
         mock_client.__enter__.return_value.get.side_effect = httpx.HTTPError(
             "Connection timeout"
         )
-        _ = mocker.patch("mkapidocs.validators.httpx.Client", return_value=mock_client)
+        _ = mocker.patch("httpx.Client", return_value=mock_client)
 
         # Mock console.print to avoid output
         _ = mocker.patch("mkapidocs.validators.console.print")
@@ -368,7 +374,7 @@ class TestDoxygenInstaller:
 
         mock_client = mocker.MagicMock()
         mock_client.__enter__.return_value.get.return_value = mock_response
-        _ = mocker.patch("mkapidocs.validators.httpx.Client", return_value=mock_client)
+        _ = mocker.patch("httpx.Client", return_value=mock_client)
 
         # Mock console.print
         _ = mocker.patch("mkapidocs.validators.console.print")
@@ -397,10 +403,10 @@ class TestDoxygenInstaller:
         tarball_path = tmp_path / "doxygen-1.9.8.tar.gz"
         tarball_path.touch()
 
-        # Mock Path operations
-        extract_dir = tmp_path / "extracted"
-        extract_dir.mkdir()
-        doxygen_bin = extract_dir / "bin" / "doxygen"
+        # Lay out the tree the (mocked) extraction would have produced
+        extract_dir = tmp_path / "cache" / "extracted"
+        (extract_dir / "doxygen-1.9.8" / "man" / "man1").mkdir(parents=True)
+        doxygen_bin = extract_dir / "doxygen-1.9.8" / "bin" / "doxygen"
         doxygen_bin.parent.mkdir()
         doxygen_bin.touch()
 
@@ -409,13 +415,8 @@ class TestDoxygenInstaller:
         _ = mocker.patch("tarfile.open", return_value=mock_tar)
         mock_tar.__enter__.return_value.extractall = mocker.MagicMock()
 
-        # Mock os.walk to find doxygen binary
-        _ = mocker.patch(
-            "os.walk", return_value=[(str(doxygen_bin.parent), [], ["doxygen"])]
-        )
-
         # Mock shutil.copy2
-        _ = mocker.patch("shutil.copy2")
+        copy2 = mocker.patch("shutil.copy2")
 
         # Mock Path methods
         _ = mocker.patch.object(Path, "chmod")
@@ -436,6 +437,7 @@ class TestDoxygenInstaller:
         # Assert
         assert success is True
         assert "Doxygen installed to" in message
+        copy2.assert_called_once_with(doxygen_bin, tmp_path / "install" / "doxygen")
 
     def test_install_linux_binary_no_binary_found(
         self, mocker: MockerFixture, tmp_path: Path
@@ -443,7 +445,7 @@ class TestDoxygenInstaller:
         """Test _install_linux_binary handles missing binary in archive.
 
         Tests: DoxygenInstaller._install_linux_binary() error handling
-        How: Mock os.walk to return no doxygen binary
+        How: Extract into a tree that contains no doxygen binary
         Why: Verify error handling for malformed archives
 
         Args:
@@ -458,8 +460,10 @@ class TestDoxygenInstaller:
         mock_tar = mocker.MagicMock()
         _ = mocker.patch("tarfile.open", return_value=mock_tar)
 
-        # Mock os.walk to find no doxygen binary
-        _ = mocker.patch("os.walk", return_value=[("/some/path", [], ["README.md"])])
+        # Extracted tree has no doxygen binary
+        extract_dir = tmp_path / "cache" / "extracted" / "doxygen-1.9.8"
+        extract_dir.mkdir(parents=True)
+        (extract_dir / "README.md").touch()
 
         _ = mocker.patch(
             "mkapidocs.validators.DoxygenInstaller.CACHE_DIR", tmp_path / "cache"
@@ -599,6 +603,41 @@ class TestSystemValidator:
         assert "https://docs.astral.sh/uv/" in result.message
         assert result.required is True
 
+    def test_check_git_memoizes_version_probe(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test repeated check_git calls reuse the cached version probe.
+
+        Tests: SystemValidator.check_git() memoization
+        How: Point which() at a real file, call check_git twice, then touch the file
+        Why: Verify version subprocess runs once per binary mtime
+
+        Args:
+            mocker: pytest-mock fixture for mocking
+            tmp_path: Temporary directory for fake git binary
+        """
+        # Arrange
+        fake_git = tmp_path / "git"
+        _ = fake_git.write_text("")
+        _ = mocker.patch("mkapidocs.validators.which", return_value=str(fake_git))
+        mock_result = mocker.MagicMock()
+        mock_result.stdout = "git version 2.39.0"
+        mock_run = mocker.patch("subprocess.run", return_value=mock_result)
+
+        # Act
+        first = SystemValidator.check_git()
+        second = SystemValidator.check_git()
+
+        # Assert
+        assert first.value == second.value == "2.39.0"
+        assert mock_run.call_count == 1
+
+        # Binary replaced - mtime changes, cache entry no longer matches
+        stat = fake_git.stat()
+        os.utime(fake_git, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        _ = SystemValidator.check_git()
+        assert mock_run.call_count == 2
+
     def test_check_doxygen_installed(self, mocker: MockerFixture) -> None:
         """Test check_doxygen returns passing result when doxygen found.
 
@@ -1033,3 +1072,212 @@ class TestValidationResult:
         assert result.message == "Found"
         assert result.value == "1.2.3"
         assert result.required is False
+
+
+class TestDisplayValidationResults:
+    """Test suite for display_validation_results function.
+
+    Tests the failure table rendering.
+    """
+
+    def test_display_renders_messages_literally(self) -> None:
+        """Test failure details are rendered as plain text, not Rich markup.
+
+        Tests: display_validation_results()
+        How: Capture console output for a failure whose message contains brackets
+        Why: Cells are built as Text objects, so user paths must not be parsed as markup
+        """
+        # Arrange
+        results = [
+            ValidationResult(
+                check_name="Path exists",
+                passed=False,
+                message="Path does not exist: /tmp/[bold]repo",
+                required=True,
+            ),
+            ValidationResult(
+                check_name="Doxygen", passed=False, message="Not found", required=False
+            ),
+        ]
+
+        # Act
+        with validators_console.capture() as capture:
+            display_validation_results(results)
+        output = capture.get()
+
+        # Assert
+        assert "/tmp/[bold]repo" in output
+        assert "\u274c" in output
+        assert "\u26a0" in output
+
+    def test_display_silent_when_all_passed(self) -> None:
+        """Test nothing is printed when every check passed.
+
+        Tests: display_validation_results()
+        How: Capture console output for passing results only
+        Why: Validation is silent on success
+        """
+        # Arrange
+        results = [ValidationResult(check_name="Git", passed=True, message="Installed")]
+
+        # Act
+        with validators_console.capture() as capture:
+            display_validation_results(results)
+
+        # Assert
+        assert capture.get() == ""
+
+
+class TestValidateEnvironment:
+    """Test suite for validate_environment function.
+
+    Tests orchestration of system and project checks, including Doxygen auto-install.
+    """
+
+    def test_auto_install_replaces_doxygen_row(
+        self, mocker: MockerFixture, mock_repo_path: Path
+    ) -> None:
+        """Test successful auto-install swaps the Doxygen result in place.
+
+        Tests: validate_environment(auto_install_doxygen=True)
+        How: Fail the first Doxygen check, report C code, succeed the install
+        Why: Verify the re-checked result replaces the original row without reordering
+
+        Args:
+            mocker: pytest-mock fixture for mocking
+            mock_repo_path: Temporary repository directory
+        """
+        # Arrange
+        passed = ValidationResult(check_name="Tool", passed=True, message="Installed")
+        _ = mocker.patch.object(SystemValidator, "check_git", return_value=passed)
+        _ = mocker.patch.object(SystemValidator, "check_uv", return_value=passed)
+        missing = ValidationResult(
+            check_name="Doxygen", passed=False, message="Not found", required=False
+        )
+        installed = ValidationResult(
+            check_name="Doxygen", passed=True, message="Installed", required=False
+        )
+        _ = mocker.patch.object(
+            SystemValidator, "check_doxygen", side_effect=[missing, installed]
+        )
+        _ = mocker.patch.object(
+            ProjectValidator,
+            "check_c_code",
+            return_value=ValidationResult(
+                check_name="C/C++ code",
+                passed=True,
+                message="Found in: source",
+                value="Doxygen required",
+                required=False,
+            ),
+        )
+        install = mocker.patch.object(
+            DoxygenInstaller,
+            "download_and_install",
+            return_value=(True, "Doxygen installed"),
+        )
+        _ = mocker.patch("mkapidocs.validators.console.print")
+
+        # Act
+        _, results = validate_environment(mock_repo_path, auto_install_doxygen=True)
+
+        # Assert
+        install.assert_called_once()
+        assert results[2] is installed
+        assert [r.check_name for r in results].count("Doxygen") == 1
+
+    def test_no_auto_install_when_disabled(
+        self, mocker: MockerFixture, mock_repo_path: Path
+    ) -> None:
+        """Test Doxygen is never installed when auto-install is off.
+
+        Tests: validate_environment(auto_install_doxygen=False)
+        How: Report missing Doxygen and C code, leave auto-install disabled
+        Why: Verify the install path is skipped entirely
+
+        Args:
+            mocker: pytest-mock fixture for mocking
+            mock_repo_path: Temporary repository directory
+        """
+        # Arrange
+        _ = mocker.patch.object(
+            SystemValidator,
+            "check_doxygen",
+            return_value=ValidationResult(
+                check_name="Doxygen", passed=False, message="Not found", required=False
+            ),
+        )
+        install = mocker.patch.object(DoxygenInstaller, "download_and_install")
+
+        # Act
+        _, results = validate_environment(mock_repo_path)
+
+        # Assert
+        install.assert_not_called()
+        assert results[2].check_name == "Doxygen"
+        assert results[2].passed is False
+
+    def test_results_keep_check_order_with_concurrent_system_checks(
+        self, mocker: MockerFixture, mock_repo_path: Path
+    ) -> None:
+        """Test results list system checks first, in order, then project checks.
+
+        Tests: validate_environment result ordering
+        How: Make the first system check finish last and inspect the result names
+        Why: System checks run on worker threads but the table order must not change
+
+        Args:
+            mocker: pytest-mock fixture for mocking
+            mock_repo_path: Temporary repository directory
+        """
+        # Arrange
+        uv_done = threading.Event()
+
+        def slow_git() -> ValidationResult:
+            uv_done.wait(timeout=5)
+            return ValidationResult(check_name="Git", passed=True, message="Installed")
+
+        def fast_uv() -> ValidationResult:
+            uv_done.set()
+            return ValidationResult(check_name="uv", passed=True, message="Installed")
+
+        _ = mocker.patch.object(SystemValidator, "check_git", side_effect=slow_git)
+        _ = mocker.patch.object(SystemValidator, "check_uv", side_effect=fast_uv)
+
+        # Act
+        _, results = validate_environment(mock_repo_path)
+
+        # Assert
+        names = [r.check_name for r in results]
+        assert names[:4] == ["Git", "uv", "Doxygen", "Path exists"]
+
+    def test_system_checks_run_on_shared_worker_pool(
+        self, mocker: MockerFixture, mock_repo_path: Path
+    ) -> None:
+        """Test repeated validations reuse the shared worker threads.
+
+        Tests: validate_environment use of get_executor
+        How: Record the thread running check_git across two validations
+        Why: Each validation should not pay for starting and joining a new pool
+
+        Args:
+            mocker: pytest-mock fixture for mocking
+            mock_repo_path: Temporary repository directory
+        """
+        # Arrange
+        thread_names: list[str] = []
+
+        def record_git() -> ValidationResult:
+            thread_names.append(threading.current_thread().name)
+            return ValidationResult(check_name="Git", passed=True, message="Installed")
+
+        _ = mocker.patch.object(SystemValidator, "check_git", side_effect=record_git)
+
+        # Act
+        _ = validate_environment(mock_repo_path)
+        _ = validate_environment(mock_repo_path)
+
+        # Assert
+        assert len(thread_names) == 2
+        assert all(name.startswith("mkapidocs") for name in thread_names)
+        assert get_executor() is get_executor()
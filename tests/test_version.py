@@ -0,0 +1,34 @@
+"""Tests for package version resolution."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+_PROBE = """
+import sys
+import mkapidocs
+
+assert "mkapidocs.version" not in sys.modules, "version resolved at import"
+first = mkapidocs.__version__
+assert "mkapidocs.version" in sys.modules
+assert mkapidocs.__dict__["__version__"] == first, "version not cached"
+print(first)
+"""
+
+
+def test_version_resolved_lazily_and_cached() -> None:
+    """Test __version__ is computed on first access and then cached.
+
+    Tests: mkapidocs.__getattr__ lazy version lookup
+    How: Import the package in a fresh interpreter and inspect sys.modules
+    Why: The metadata lookup must not run on every CLI start, nor more than once
+    """
+    # Act - a fresh interpreter, because conftest replaces sys.modules["mkapidocs"]
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE], capture_output=True, text=True, check=False
+    )
+
+    # Assert
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip()
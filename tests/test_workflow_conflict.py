@@ -74,6 +74,38 @@ jobs:
     )
 
 
+def test_github_actions_existing_pages_environment_job(
+    mock_repo_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test that a job targeting the github-pages environment counts as a pages job."""
+    github_dir = mock_repo_path / ".github" / "workflows"
+    github_dir.mkdir(parents=True, exist_ok=True)
+
+    # Pages job identified by its environment, with mkapidocs in a later step
+    (github_dir / "docs.yml").write_text("""
+name: Docs
+on: [push]
+jobs:
+  publish:
+    runs-on: ubuntu-latest
+    environment:
+      name: github-pages
+    steps:
+      - uses: actions/checkout@v4
+      - run: uv sync
+      - run: uv run mkapidocs build .
+""")
+
+    create_github_actions(mock_repo_path)
+
+    assert not (github_dir / "pages.yml").exists()
+    captured = capsys.readouterr()
+    assert (
+        "Found existing pages deployment job 'publish' in 'docs.yml' using mkapidocs"
+        in captured.out
+    )
+
+
 def test_github_actions_no_conflict(
     mock_repo_path: Path, capsys: pytest.CaptureFixture[str]
 ) -> None:
@@ -0,0 +1,343 @@
+"""Tests for YAML utility functions."""
+# pyright: reportPrivateUsage=false
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+from ruamel.yaml.util import load_yaml_guess_indent
+
+from mkapidocs import yaml_utils
+from mkapidocs.yaml_utils import (
+    FileChange,
+    _build_owned_key_trie,
+    _detect_yaml_indentation,
+    _guess_yaml_indent,
+    append_to_yaml_list,
+    console as yaml_console,
+    display_file_changes,
+    load_yaml_from_path,
+    merge_mkdocs_yaml,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+def test_load_yaml_from_path_reuses_parse_for_unchanged_file(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    """Test repeated loads of an unchanged file parse it only once.
+
+    Tests: load_yaml_from_path memoization
+    How: Load the same file twice while spying on load_yaml
+    Why: Several generator steps read the same YAML file during one run
+    """
+    # Arrange
+    config = tmp_path / "config.yml"
+    config.write_text("site_name: demo\nnav:\n  - index.md\n")
+    spy = mocker.spy(yaml_utils, "load_yaml")
+
+    # Act
+    first = load_yaml_from_path(config)
+    second = load_yaml_from_path(config)
+
+    # Assert
+    assert first == {"site_name": "demo", "nav": ["index.md"]}
+    assert second == first
+    assert spy.call_count == 1
+
+
+def test_load_yaml_from_path_returns_independent_copies(tmp_path: Path) -> None:
+    """Test callers cannot corrupt the cached parse by mutating results.
+
+    Tests: load_yaml_from_path copy semantics
+    How: Mutate the first result, then load again
+    Why: Cached data is shared between callers
+    """
+    # Arrange
+    config = tmp_path / "config.yml"
+    config.write_text("nav:\n  - index.md\n")
+    first = load_yaml_from_path(config)
+    assert first is not None
+
+    # Act
+    first["nav"] = []
+    second = load_yaml_from_path(config)
+
+    # Assert
+    assert second == {"nav": ["index.md"]}
+
+
+def test_load_yaml_from_path_reparses_after_file_change(tmp_path: Path) -> None:
+    """Test edits to the file invalidate the cached parse.
+
+    Tests: load_yaml_from_path cache key
+    How: Rewrite the file with same-size content and restore its mtime
+    Why: Stale configuration must never be returned after an edit, even one
+        the file's size and timestamps do not reveal
+    """
+    # Arrange
+    config = tmp_path / "config.yml"
+    config.write_text("site_name: old\n")
+    original_stat = config.stat()
+    assert load_yaml_from_path(config) == {"site_name": "old"}
+
+    # Act
+    config.write_text("site_name: new\n")
+    os.utime(config, ns=(original_stat.st_atime_ns, original_stat.st_mtime_ns))
+    result = load_yaml_from_path(config)
+
+    # Assert
+    assert config.stat().st_size == original_stat.st_size
+    assert result == {"site_name": "new"}
+
+
+def test_load_yaml_from_path_missing_file_returns_none(tmp_path: Path) -> None:
+    """Test a missing file yields None.
+
+    Tests: load_yaml_from_path missing file handling
+    How: Load a path that does not exist
+    Why: Callers treat None as "no configuration present"
+    """
+    # Act
+    result = load_yaml_from_path(tmp_path / "absent.yml")
+
+    # Assert
+    assert result is None
+
+
+def test_build_owned_key_trie_nests_dotted_paths() -> None:
+    """Test dotted owned-key paths become a nested trie.
+
+    Tests: _build_owned_key_trie structure
+    How: Build a trie from nested and overlapping key paths
+    Why: Merge decides ownership by walking this trie level by level
+    """
+    # Act
+    trie = _build_owned_key_trie(
+        frozenset({
+            "plugins.search",
+            "plugins.gen-files.scripts",
+            "theme.name",
+            "theme",
+            "theme.palette",
+        })
+    )
+
+    # Assert
+    assert trie == {
+        "plugins": {"search": None, "gen-files": {"scripts": None}},
+        "theme": None,
+    }
+
+
+def test_build_owned_key_trie_is_reused_for_same_key_set() -> None:
+    """Test the owned-key trie is built once per distinct key set.
+
+    Tests: _build_owned_key_trie memoization
+    How: Build tries from equal frozensets and compare identity
+    Why: Repeated merges with the same template must not redo the setup
+    """
+    # Act
+    first = _build_owned_key_trie(frozenset({"theme.name", "site_url"}))
+    second = _build_owned_key_trie(frozenset({"site_url", "theme.name"}))
+
+    # Assert
+    assert first is second
+
+
+def test_merge_mkdocs_yaml_replaces_only_owned_keys(tmp_path: Path) -> None:
+    """Test merge overwrites template-owned keys and preserves the rest.
+
+    Tests: merge_mkdocs_yaml ownership rules
+    How: Merge a template into a file that customizes owned and unowned keys
+    Why: User customizations outside template-owned keys must survive updates
+    """
+    # Arrange
+    existing = tmp_path / "mkdocs.yml"
+    existing.write_text(
+        "site_name: mine\n"
+        "theme:\n"
+        "  name: readthedocs\n"
+        "  logo: logo.png\n"
+        "plugins:\n"
+        "  search:\n"
+        "    lang: fr\n"
+    )
+    template = (
+        "site_name: template\n"
+        "theme:\n"
+        "  name: material\n"
+        "  logo: default.png\n"
+        "plugins:\n"
+        "  search: {}\n"
+    )
+
+    # Act
+    merged, changes = merge_mkdocs_yaml(existing, template)
+
+    # Assert
+    assert "name: material" in merged
+    assert "logo: logo.png" in merged
+    assert "site_name: mine" in merged
+    assert "lang: fr" not in merged
+    updated = {c.key_path for c in changes if c.action == "updated"}
+    assert updated == {"theme.name", "plugins.search"}
+
+
+def test_merge_mkdocs_yaml_records_raw_values(tmp_path: Path) -> None:
+    """Test change records keep raw values instead of preformatted strings.
+
+    Tests: FileChange value storage
+    How: Merge a file with a user-only nested key and inspect its record
+    Why: Stringifying large preserved subtrees is deferred to display time
+    """
+    # Arrange
+    existing = tmp_path / "mkdocs.yml"
+    existing.write_text("site_name: mine\nextra:\n  version: 1\n")
+
+    # Act
+    _, changes = merge_mkdocs_yaml(existing, "site_name: template\n")
+
+    # Assert
+    extra = next(c for c in changes if c.key_path == "extra")
+    assert extra.action == "preserved"
+    assert extra.old_value == {"version": 1}
+    assert extra.new_value is None
+
+
+def test_append_to_yaml_list_writes_utf8_and_keeps_comments(tmp_path: Path) -> None:
+    """Test appending to a list rewrites the file as UTF-8 with comments intact.
+
+    Tests: append_to_yaml_list file output
+    How: Append to a commented list containing non-ASCII text and reread bytes
+    Why: The YAML is emitted straight to a binary file handle
+    """
+    # Arrange
+    ci_file = tmp_path / ".gitlab-ci.yml"
+    ci_file.write_text("# pipeline café\nstages:\n- build\n", encoding="utf-8")
+
+    # Act
+    result = append_to_yaml_list(ci_file, "stages", "pages")
+
+    # Assert
+    assert result is True
+    content = ci_file.read_bytes().decode("utf-8")
+    assert content == "# pipeline café\nstages:\n- build\n- pages\n"
+
+
+def test_detect_yaml_indentation_reads_offset_sequences() -> None:
+    """Test indentation detection for lists indented under their parent key.
+
+    Tests: _detect_yaml_indentation offset style
+    How: Detect indentation of content whose dashes sit two spaces in
+    Why: Merged files must be written back in the user's own style
+    """
+    # Arrange
+    content = "theme:\n  palette:\n    - scheme: default\n      primary: indigo\n"
+
+    # Act
+    result = _detect_yaml_indentation(content)
+
+    # Assert
+    assert result == (2, 4, 2)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "theme:\n  name: material\n",
+        "nav:\n- index.md\n- api.md\n",
+        "theme:\n  palette:\n    - scheme: default\n      primary: indigo\n",
+        "plugins:\n    -   search\n",
+        "nav:\n  - # first\n  -  index.md\n",
+        "site_name: demo\n",
+    ],
+    ids=["mapping", "flush-dash", "offset-dash", "wide-dash", "comment-item", "flat"],
+)
+def test_guess_yaml_indent_matches_ruamel_utility(content: str) -> None:
+    """Test the in-module indent scan agrees with ruamel.yaml's own guess.
+
+    Tests: _guess_yaml_indent parity with load_yaml_guess_indent
+    How: Compare both results for mapping, sequence and comment layouts
+    Why: The scan is a port, so files must keep being written in the same style
+
+    Args:
+        content: YAML document to scan
+    """
+    # Act
+    result = _guess_yaml_indent(content)
+
+    # Assert
+    _, indent, block_seq_indent = load_yaml_guess_indent(content)
+    assert result == (indent, block_seq_indent)
+
+
+def test_merge_mkdocs_yaml_does_not_need_ruamel_indent_utility(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    """Test merging works when ruamel's indent utility rejects a custom loader.
+
+    Tests: merge_mkdocs_yaml compatibility with ruamel.yaml 0.18.0-0.18.10
+    How: Replace load_yaml_guess_indent with one that raises TypeError, then merge
+    Why: Before 0.18.11 the utility forwards yaml= to YAML.load, which raises
+
+    Args:
+        tmp_path: Pytest fixture for temporary directories
+        mocker: pytest-mock fixture for patching
+    """
+    # Arrange - both the library function and any module-level import of it
+    legacy_error = TypeError("load() got an unexpected keyword argument 'yaml'")
+    _ = mocker.patch(
+        "ruamel.yaml.util.load_yaml_guess_indent", side_effect=legacy_error
+    )
+    _ = mocker.patch.object(
+        yaml_utils, "load_yaml_guess_indent", side_effect=legacy_error, create=True
+    )
+    existing = tmp_path / "mkdocs.yml"
+    existing.write_text("site_name: mine\nnav:\n  - index.md\n", encoding="utf-8")
+
+    # Act
+    merged, _ = merge_mkdocs_yaml(existing, "site_name: template\n")
+
+    # Assert
+    assert "  - index.md" in merged
+
+
+def test_display_file_changes_renders_values_literally(tmp_path: Path) -> None:
+    """Test change table cells are plain text, not Rich markup.
+
+    Tests: display_file_changes cell rendering
+    How: Capture output for changes whose values contain square brackets
+    Why: Cells are built as Text objects, so YAML values must not be parsed as markup
+    """
+    # Arrange
+    changes = [
+        FileChange(
+            key_path="theme.name",
+            action="updated",
+            old_value="[bold]x",
+            new_value="material",
+        ),
+        FileChange(
+            key_path="site_url", action="added", new_value="https://example.com"
+        ),
+        FileChange(key_path="nav", action="preserved", old_value=["index.md"]),
+    ]
+
+    # Act
+    with yaml_console.capture() as capture:
+        display_file_changes(tmp_path / "mkdocs.yml", changes)
+    output = capture.get()
+
+    # Assert
+    assert "[bold]x" in output
+    assert "Updated" in output
+    assert "Added" in output
+    assert "\u2705" in output
+    assert "nav" not in output